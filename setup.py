@@ -29,6 +29,9 @@ setup(
     ],
     python_requires=">=3.11",
     install_requires=requirements,
+    extras_require={
+        "fast": ["orjson==3.10.7"],
+    },
     entry_points={
         "console_scripts": [
             "gdrive-explorer=gdrive_explorer.cli:main",
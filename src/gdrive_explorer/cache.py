@@ -14,6 +14,11 @@ from .models import DriveItem, DriveStructure
 from .config import get_config
 from .utils import ensure_directory_exists
 
+try:
+    import orjson
+except ImportError:  # Optional speedup, installed with the 'fast' extra
+    orjson = None  # type: ignore[assignment]
+
 
 logger = logging.getLogger(__name__)
 
@@ -157,9 +162,21 @@ class DriveCache:
             )
         ''')
         
+        # Create api_responses table for raw Drive API pages
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS api_responses (
+                key TEXT PRIMARY KEY,
+                data BLOB NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                expires_at TIMESTAMP NOT NULL,
+                size_bytes INTEGER DEFAULT 0
+            )
+        ''')
+        
         # Create indexes for performance
         conn.execute('CREATE INDEX IF NOT EXISTS idx_drive_items_expires ON drive_items(expires_at)')
         conn.execute('CREATE INDEX IF NOT EXISTS idx_structures_expires ON drive_structures(expires_at)')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_api_responses_expires ON api_responses(expires_at)')
     
     @contextmanager
     def _get_connection(self):
@@ -370,6 +387,82 @@ class DriveCache:
             logger.error(f"Error retrieving cached structure {structure_id}: {e}")
             return None
     
+    def cache_response(self, key: str, response: Dict[str, Any]) -> bool:
+        """Cache a raw Drive API response.
+        
+        Args:
+            key: Unique key identifying the request
+            response: JSON-serializable response body
+            
+        Returns:
+            True if successfully cached
+        """
+        if not self.enabled:
+            return False
+        
+        try:
+            if orjson is not None:
+                data = orjson.dumps(response)
+            else:
+                data = json.dumps(response).encode('utf-8')
+            expires_at = self._calculate_expiry()
+            
+            with self._get_connection() as conn:
+                conn.execute('''
+                    INSERT OR REPLACE INTO api_responses 
+                    (key, data, expires_at, size_bytes)
+                    VALUES (?, ?, ?, ?)
+                ''', (key, data, expires_at.isoformat(), len(data)))
+                
+                conn.commit()
+                
+            logger.debug(f"Cached API response: {key}")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error caching API response {key}: {e}")
+            return False
+    
+    def get_response(self, key: str) -> Optional[Dict[str, Any]]:
+        """Retrieve a cached Drive API response.
+        
+        Args:
+            key: Unique key identifying the request
+            
+        Returns:
+            Cached response body or None if not found/expired
+        """
+        if not self.enabled:
+            return None
+        
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.execute(
+                    'SELECT data, expires_at FROM api_responses WHERE key = ?',
+                    (key,)
+                )
+                row = cursor.fetchone()
+                
+                if row is None:
+                    return None
+                
+                if self._is_expired(row['expires_at']):
+                    # Remove expired entry
+                    conn.execute('DELETE FROM api_responses WHERE key = ?', (key,))
+                    conn.commit()
+                    return None
+                
+                # Both encoders write plain UTF-8 JSON, so either can read it back
+                if orjson is not None:
+                    data: Dict[str, Any] = orjson.loads(row['data'])
+                else:
+                    data = json.loads(row['data'])
+                return data
+                
+        except Exception as e:
+            logger.error(f"Error retrieving cached API response {key}: {e}")
+            return None
+    
     def invalidate_item(self, item_id: str) -> bool:
         """Remove an item from cache.
         
@@ -418,6 +511,10 @@ class DriveCache:
                 cursor = conn.execute('DELETE FROM drive_structures WHERE expires_at < ?', (now,))
                 removed_count += cursor.rowcount
                 
+                # Remove expired API responses
+                cursor = conn.execute('DELETE FROM api_responses WHERE expires_at < ?', (now,))
+                removed_count += cursor.rowcount
+                
                 conn.commit()
                 
             if removed_count > 0:
@@ -442,6 +539,7 @@ class DriveCache:
             with self._get_connection() as conn:
                 conn.execute('DELETE FROM drive_items')
                 conn.execute('DELETE FROM drive_structures')
+                conn.execute('DELETE FROM api_responses')
                 conn.execute('DELETE FROM cache_metadata')
                 conn.commit()
                 
@@ -492,7 +590,12 @@ class DriveCache:
                 cursor = conn.execute('SELECT SUM(size_bytes) as total_size FROM drive_structures')
                 structures_size = cursor.fetchone()['total_size'] or 0
                 
-                total_size = items_size + structures_size
+                cursor = conn.execute('SELECT COUNT(*) as count, SUM(size_bytes) as total_size FROM api_responses')
+                row = cursor.fetchone()
+                stats['responses_count'] = row['count']
+                responses_size = row['total_size'] or 0
+                
+                total_size = items_size + structures_size + responses_size
                 stats['total_size_bytes'] = total_size
                 stats['total_size_mb'] = total_size / (1024 * 1024)
                 
@@ -509,7 +612,10 @@ class DriveCache:
                 cursor = conn.execute('SELECT COUNT(*) as count FROM drive_structures WHERE expires_at < ?', (now,))
                 expired_structures = cursor.fetchone()['count']
                 
-                stats['expired_count'] = expired_items + expired_structures
+                cursor = conn.execute('SELECT COUNT(*) as count FROM api_responses WHERE expires_at < ?', (now,))
+                expired_responses = cursor.fetchone()['count']
+                
+                stats['expired_count'] = expired_items + expired_structures + expired_responses
                 
             return stats
             
@@ -2,7 +2,7 @@
 
 import logging
 import time
-from typing import Dict, List, Optional, Set, Callable
+from typing import Dict, List, Optional, Set, Callable, Tuple
 from datetime import datetime
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from googleapiclient.errors import HttpError
@@ -33,7 +33,7 @@ class RateLimitError(SizeCalculationError):
 
 
 class DriveCalculator:
-    """Handles recursive size calculation for Google Drive folder structures."""
+    """Handles folder size calculation for Google Drive folder structures."""
     
     def __init__(self, client: Optional[DriveClient] = None):
         """Initialize the calculator.
@@ -57,6 +57,8 @@ class DriveCalculator:
         # Internal tracking
         self._calculated_folders: Dict[str, int] = {}
         self._processing_folders: Set[str] = set()
+        # Reused between calls so walking a tree doesn't reallocate the stack
+        self._folder_stack: List[Tuple[DriveItem, bool]] = []
     
     def calculate_full_drive_sizes(self, 
                                    structure: DriveStructure,
@@ -95,7 +97,7 @@ class DriveCalculator:
             processed = 0
             for folder in folders_to_calculate:
                 try:
-                    self._calculate_folder_size_recursive(folder, structure)
+                    self._calculate_folder_size(folder, structure)
                     processed += 1
                     
                     if progress_callback:
@@ -126,7 +128,7 @@ class DriveCalculator:
                     # Wait and retry once
                     time.sleep(2)
                     try:
-                        self._calculate_folder_size_recursive(folder, structure)
+                        self._calculate_folder_size(folder, structure)
                         processed += 1
                     except Exception:
                         logger.error(f"Retry failed for folder '{folder.name}'")
@@ -155,8 +157,13 @@ class DriveCalculator:
             logger.error(f"Error during size calculation: {e}")
             raise SizeCalculationError(f"Failed to calculate Drive sizes: {e}")
     
-    def _calculate_folder_size_recursive(self, folder: DriveItem, structure: DriveStructure) -> int:
-        """Recursively calculate the size of a folder.
+    def _calculate_folder_size(self, folder: DriveItem, structure: DriveStructure) -> int:
+        """Calculate the size of a folder and every subfolder below it.
+        
+        Subfolders are walked with an explicit stack rather than recursion,
+        so deep trees can't hit the interpreter's recursion limit. Each
+        folder is popped twice: once to queue its subfolders and once, after
+        they're done, to total its children.
         
         Args:
             folder: Folder to calculate size for
@@ -165,11 +172,48 @@ class DriveCalculator:
         Returns:
             Total size of folder in bytes
         """
-        # Avoid circular references and double processing
-        if folder.id in self._processing_folders:
-            logger.warning(f"Circular reference detected for folder: {folder.name}")
-            return 0
+        stack = self._folder_stack
+        stack.append((folder, False))
+        
+        try:
+            while stack:
+                current, children_done = stack.pop()
+                
+                if children_done:
+                    self._total_folder(current)
+                    self._processing_folders.discard(current.id)
+                    continue
+                
+                # Avoid circular references and double processing
+                if current.id in self._processing_folders:
+                    logger.warning(f"Circular reference detected for folder: {current.name}")
+                    continue
+                
+                if self._known_folder_size(current) is not None:
+                    continue
+                
+                # Mark as being processed and total it once its subfolders are done
+                self._processing_folders.add(current.id)
+                stack.append((current, True))
+                stack.extend((child, False) for child in current.children if child.is_folder)
+        finally:
+            # Unmark folders an error left unfinished and leave the stack empty for reuse
+            for current, children_done in stack:
+                if children_done:
+                    self._processing_folders.discard(current.id)
+            stack.clear()
         
+        return self._calculated_folders.get(folder.id, 0)
+    
+    def _known_folder_size(self, folder: DriveItem) -> Optional[int]:
+        """Look up a folder size that doesn't need calculating.
+        
+        Args:
+            folder: Folder to look up
+            
+        Returns:
+            Size in bytes, or None if the folder has to be calculated
+        """
         # Check if already calculated
         if folder.id in self._calculated_folders:
             self._cache_hits += 1
@@ -195,63 +239,57 @@ class DriveCalculator:
             self._cache_hits += 1
             return folder.calculated_size
         
-        # Mark as being processed
-        self._processing_folders.add(folder.id)
+        return None
+    
+    def _total_folder(self, folder: DriveItem) -> int:
+        """Total a folder's children once all its subfolders are calculated.
         
-        try:
-            total_size = 0
-            file_count = 0
-            folder_count = 0
-            
-            # Process all children
-            for child in folder.children:
-                if child.is_folder:
-                    # Recursively calculate subfolder size
-                    child_size = self._calculate_folder_size_recursive(child, structure)
-                    total_size += child_size
-                    folder_count += 1
-                    # Don't double-count nested folders - they're already included in child.folder_count
-                    # This was causing exponential performance issues
-                else:
-                    # Add file size directly
-                    # Note: Google Workspace files have size=0, but we still count them
-                    total_size += child.size
-                    file_count += 1
-                    
-                    # Log Google Workspace files for debugging
-                    if child.is_google_workspace_file and child.size == 0:
-                        logger.debug(f"Google Workspace file found: {child.name} ({child.type})")
-            
-            # Add nested counts from all subfolders
-            for child in folder.children:
-                if child.is_folder:
-                    folder_count += child.folder_count  # Add nested folder counts
-                    file_count += child.file_count      # Add nested file counts
-            
-            # Update folder metadata
-            folder.calculated_size = total_size
-            folder.file_count = file_count
-            folder.folder_count = folder_count
-            folder.last_scanned = datetime.now()
-            folder.scan_complete = True
-            
-            # Cache the result in memory and persistent cache
-            self._calculated_folders[folder.id] = total_size
-            self._processed_items += 1
-            self._total_size_calculated += total_size
-            
-            # Cache individual folder for future use
-            if self.config.cache.enabled:
-                self.cache.cache_item(folder)
-            
-            logger.debug(f"Calculated size for '{folder.name}': {format_file_size(total_size)} "
-                        f"({file_count} files, {folder_count} folders)")
-            
-            return total_size
+        Args:
+            folder: Folder whose subfolders are done
             
-        finally:
-            # Remove from processing set
-            self._processing_folders.discard(folder.id)
+        Returns:
+            Total size of folder in bytes
+        """
+        total_size = 0
+        file_count = 0
+        folder_count = 0
+        calculated = self._calculated_folders
+        
+        for child in folder.children:
+            if child.is_folder:
+                # Subfolders skipped as circular references count as empty
+                total_size += calculated.get(child.id, 0)
+                folder_count += 1 + child.folder_count
+                file_count += child.file_count
+            else:
+                # Google Workspace files have size=0, but we still count them
+                total_size += child.size
+                file_count += 1
+                
+                # Log Google Workspace files for debugging
+                if child.is_google_workspace_file and child.size == 0:
+                    logger.debug(f"Google Workspace file found: {child.name} ({child.type})")
+        
+        # Update folder metadata
+        folder.calculated_size = total_size
+        folder.file_count = file_count
+        folder.folder_count = folder_count
+        folder.last_scanned = datetime.now()
+        folder.scan_complete = True
+        
+        # Cache the result in memory and persistent cache
+        calculated[folder.id] = total_size
+        self._processed_items += 1
+        self._total_size_calculated += total_size
+        
+        # Cache individual folder for future use
+        if self.config.cache.enabled:
+            self.cache.cache_item(folder)
+        
+        logger.debug(f"Calculated size for '{folder.name}': {format_file_size(total_size)} "
+                    f"({file_count} files, {folder_count} folders)")
+        
+        return total_size
     
     def _handle_api_error(self, error: Exception, item_name: str) -> None:
         """Handle API errors and convert to appropriate exceptions.
@@ -297,7 +335,7 @@ class DriveCalculator:
             self._add_folder_tree_to_structure(root_folder, structure)
             
             # Calculate sizes
-            total_size = self._calculate_folder_size_recursive(root_folder, structure)
+            total_size = self._calculate_folder_size(root_folder, structure)
             
             elapsed = time.time() - start_time
             logger.info(f"Tree calculation completed in {elapsed:.2f} seconds")
@@ -352,7 +390,7 @@ class DriveCalculator:
                     self.cache.invalidate_item(folder.id)
                     
                     # Recalculate size
-                    self._calculate_folder_size_recursive(folder, structure)
+                    self._calculate_folder_size(folder, structure)
                     processed += 1
                     
                     if progress_callback:
@@ -503,8 +541,8 @@ class DriveCalculator:
             List of largest folders sorted by size
         """
         folders_with_size = [
-            item for item in structure.all_items.values()
-            if item.is_folder and item.calculated_size and item.calculated_size > 0
+            item for item in structure.folders()
+            if item.calculated_size and item.calculated_size > 0
         ]
         
         folders_with_size.sort(key=lambda x: x.calculated_size, reverse=True)
@@ -519,16 +557,11 @@ class DriveCalculator:
         Returns:
             List of empty folders
         """
-        empty_folders = []
-        
-        for item in structure.all_items.values():
-            if (item.is_folder and 
-                item.scan_complete and 
-                item.file_count == 0 and 
-                item.folder_count == 0):
-                empty_folders.append(item)
-        
-        return empty_folders
+        # Only folders are visited, not every file
+        return [
+            item for item in structure.folders()
+            if item.scan_complete and item.file_count == 0 and item.folder_count == 0
+        ]
     
     def analyze_folder_distribution(self, structure: DriveStructure) -> Dict[str, any]:
         """Analyze the distribution of folder sizes.
@@ -540,8 +573,8 @@ class DriveCalculator:
             Dictionary with folder size distribution analysis
         """
         folders_with_size = [
-            item for item in structure.all_items.values()
-            if item.is_folder and item.calculated_size and item.calculated_size > 0
+            item for item in structure.folders()
+            if item.calculated_size and item.calculated_size > 0
         ]
         
         if not folders_with_size:
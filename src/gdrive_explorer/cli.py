@@ -1,20 +1,59 @@
 """Command-line interface for Google Drive Explorer."""
 
+import heapq
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import attrgetter
+from typing import List, Optional
+
 import click
 from rich.console import Console
 from rich.table import Table
+from rich.panel import Panel
 from rich import print as rprint
 
 from .auth import DriveAuthenticator
-from .client import DriveClient
+from .client import DriveClient, DISPLAY_LIST_FIELDS
 from .config import get_config
 from .utils import setup_logging, format_file_size
 from .explorer import DriveExplorer
 from .cache import get_cache
+from .models import DriveItem, DriveStructure
 from .display import DriveDisplayManager, SortBy, DisplayFormat, FilterOptions, parse_size_string
 
 
-console = Console()
+@lru_cache(maxsize=1)
+def _console() -> Console:
+    """Get the shared console, created on first use so --help never builds one."""
+    return Console()
+
+
+def _load_items(client: DriveClient, page_size: int = 1000, query: Optional[str] = None,
+                all_pages: bool = False, use_cache: bool = True) -> List[DriveItem]:
+    """Fetch files from Google Drive and convert them to DriveItems.
+    
+    Only the fields the display code reads are requested.
+    
+    Args:
+        client: Drive API client to fetch with
+        page_size: Number of files to request per page
+        query: Drive search query to filter files
+        all_pages: Follow pagination instead of stopping after one page
+        use_cache: Use cached API responses if available
+        
+    Returns:
+        List of DriveItem objects
+    """
+    if all_pages:
+        files = client.iter_files(query=query, page_size=page_size,
+                                  fields=DISPLAY_LIST_FIELDS, use_cache=use_cache)
+    else:
+        result = client.list_files(page_size=page_size, query=query,
+                                   fields=DISPLAY_LIST_FIELDS, use_cache=use_cache)
+        files = result.get('files', [])
+    
+    return DriveItem.from_drive_api_batch(files)
 
 
 @click.group()
@@ -29,6 +68,7 @@ def main(ctx, config, verbose):
     # Set up configuration
     if config:
         ctx.obj['config_file'] = config
+    ctx.obj['verbose'] = verbose
     
     # Set up logging
     app_config = get_config()
@@ -83,7 +123,10 @@ def test(limit):
         
         # Fetch some files to test
         rprint(f"[blue]Fetching first {limit} files...[/blue]")
-        result = client.list_files(page_size=limit)
+        result = client.list_files(
+            page_size=limit,
+            fields="nextPageToken, files(id, name, mimeType, size, modifiedTime)"
+        )
         files = result.get('files', [])
         
         if not files:
@@ -97,7 +140,9 @@ def test(limit):
         table.add_column("Size", style="green", justify="right")
         table.add_column("Modified", style="blue")
         
-        for file in files:
+        sizes = client.get_file_sizes_bulk(files)
+        
+        for file, size in zip(files, sizes):
             name = file.get('name', 'Unknown')
             mime_type = file.get('mimeType', '')
             
@@ -110,18 +155,14 @@ def test(limit):
                 file_type = "File"
             
             # Format size
-            size = client.get_file_size(file)
             size_str = format_file_size(size) if size > 0 else "-"
             
-            # Format date
-            modified = file.get('modifiedTime', '')
-            if modified:
-                # Simple date formatting (just take the date part)
-                modified = modified.split('T')[0]
+            # Format date (RFC 3339 timestamps start with YYYY-MM-DD)
+            modified = file.get('modifiedTime', '')[:10]
             
             table.add_row(name, file_type, size_str, modified)
         
-        console.print(table)
+        _console().print(table)
         rprint(f"[green]✓ Successfully listed {len(files)} items[/green]")
         
     except Exception as e:
@@ -147,7 +188,7 @@ def info():
     table.add_row("Default Format", config.display.default_format)
     table.add_row("Show Progress", str(config.display.show_progress))
     
-    console.print(table)
+    _console().print(table)
 
 
 @main.command()
@@ -172,7 +213,8 @@ def clear_auth():
 @click.option('--cache/--no-cache', default=True, help='Use cached data if available')
 @click.option('--path/--no-path', default=False, help='Show full path in table view')
 @click.option('--full', is_flag=True, help='Perform complete Drive scan with size calculation (Phase 3)')
-def scan(limit, format, sort, min_size, max_size, item_type, cache, path, full):
+@click.pass_context
+def scan(ctx, limit, format, sort, min_size, max_size, item_type, cache, path, full):
     """Scan and analyze Google Drive with rich visualization."""
     try:
         if full:
@@ -181,7 +223,7 @@ def scan(limit, format, sort, min_size, max_size, item_type, cache, path, full):
             rprint("[blue]🔍 Scanning Google Drive (quick preview)...[/blue]")
         
         # Initialize display manager
-        display = DriveDisplayManager(console)
+        display = DriveDisplayManager(_console())
         
         # Create filters
         filters = FilterOptions()
@@ -210,7 +252,7 @@ def scan(limit, format, sort, min_size, max_size, item_type, cache, path, full):
                 BarColumn(),
                 TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
                 TimeElapsedColumn(),
-                console=console,
+                console=_console(),
             ) as progress:
                 
                 task = progress.add_task("Scanning Drive...", total=100)
@@ -236,49 +278,25 @@ def scan(limit, format, sort, min_size, max_size, item_type, cache, path, full):
             
         else:
             # Quick preview mode
-            client = DriveClient()
+            cached_structure = None
             
-            # Check cache first
-            if cache:
-                cached_structure = get_cache().get_structure()
-                if cached_structure and cached_structure.scan_complete:
-                    rprint("[green]✓ Using cached complete drive structure[/green]")
-                    items = list(cached_structure.all_items.values())
-                else:
-                    # Fall back to quick scan
-                    rprint("[blue]Fetching sample data from Google Drive API...[/blue]")
-                    rprint(f"[yellow]Note: Limited preview with {limit * 2} items. Use --full for complete scan.[/yellow]")
-                    
-                    # Get sample data
-                    result = client.list_files(page_size=min(limit * 2, 1000))
-                    files = result.get('files', [])
-                    
-                    # Convert to DriveItem objects
-                    from .models import DriveItem
-                    items = []
-                    for file_data in files:
-                        try:
-                            item = DriveItem.from_drive_api(file_data)
-                            items.append(item)
-                        except Exception as e:
-                            continue
+            # Check cache first, reading it in the background while the
+            # API client authenticates and loads its discovery document
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                structure_future = executor.submit(get_cache().get_structure) if cache else None
+                client = DriveClient()
+                if structure_future:
+                    cached_structure = structure_future.result()
+            
+            if cached_structure and cached_structure.scan_complete:
+                rprint("[green]✓ Using cached complete drive structure[/green]")
+                items = list(cached_structure.all_items.values())
             else:
                 rprint("[blue]Fetching sample data from Google Drive API...[/blue]")
                 rprint(f"[yellow]Note: Limited preview with {limit * 2} items. Use --full for complete scan.[/yellow]")
                 
                 # Get sample data
-                result = client.list_files(page_size=min(limit * 2, 1000))
-                files = result.get('files', [])
-                
-                # Convert to DriveItem objects
-                from .models import DriveItem
-                items = []
-                for file_data in files:
-                    try:
-                        item = DriveItem.from_drive_api(file_data)
-                        items.append(item)
-                    except Exception as e:
-                        continue
+                items = _load_items(client, page_size=min(limit * 2, 1000), use_cache=cache)
         
         rprint(f"[green]✓ Loaded {len(items)} items[/green]")
         
@@ -318,7 +336,6 @@ def scan(limit, format, sort, min_size, max_size, item_type, cache, path, full):
                     if not full:
                         rprint("[yellow]Tree view with sample folder structure (use --full for complete tree):[/yellow]")
                     # Create structure for demo
-                    from .models import DriveStructure
                     temp_structure = DriveStructure()
                     for item in items:
                         temp_structure.add_item(item)
@@ -328,13 +345,12 @@ def scan(limit, format, sort, min_size, max_size, item_type, cache, path, full):
                     rprint("[yellow]No folders found for tree view[/yellow]")
         
         # Show summary stats
-        total_size = sum(item.display_size for item in filtered_items)
+        total_size = sum(map(attrgetter('display_size'), filtered_items))
         rprint(f"\n[dim]Showing {len(filtered_items)} items, total size: {format_file_size(total_size)}[/dim]")
         
     except Exception as e:
         rprint(f"[red]Error during scan: {e}[/red]")
-        import traceback
-        if click.get_current_context().find_root().params.get('verbose'):
+        if ctx.obj.get('verbose'):
             rprint(f"[red]{traceback.format_exc()}[/red]")
 
 
@@ -356,6 +372,7 @@ def cache():
         
         table.add_row("Cached Items", str(stats.get('items_count', 0)))
         table.add_row("Cached Structures", str(stats.get('structures_count', 0)))
+        table.add_row("Cached API Pages", str(stats.get('responses_count', 0)))
         table.add_row("Complete Scans", str(stats.get('complete_scans', 0)))
         table.add_row("Max Files Scanned", f"{stats.get('max_files_scanned', 0):,}")
         table.add_row("Max Folders Scanned", f"{stats.get('max_folders_scanned', 0):,}")
@@ -364,7 +381,7 @@ def cache():
         table.add_row("Database Size", f"{stats.get('database_size_mb', 0):.2f} MB")
         table.add_row("Expired Entries", str(stats.get('expired_count', 0)))
         
-        console.print(table)
+        _console().print(table)
         
         if stats.get('expired_count', 0) > 0:
             rprint("[yellow]Run 'gdrive-explorer cache --clear-expired' to clean up[/yellow]")
@@ -397,7 +414,8 @@ def cache_clear(expired_only):
 @main.command('full-scan')
 @click.option('--cache/--no-cache', default=True, help='Use cached data if available')
 @click.option('--force', '-f', is_flag=True, help='Force complete rescan even if cache exists')
-def full_scan(cache, force):
+@click.pass_context
+def full_scan(ctx, cache, force):
     """Perform a complete Google Drive scan with size calculation (Phase 3)."""
     try:
         rprint("[blue]🚀 Starting complete Google Drive analysis...[/blue]")
@@ -406,10 +424,11 @@ def full_scan(cache, force):
             cache = False
             rprint("[yellow]⚡ Forcing complete rescan (ignoring cache)[/yellow]")
         
-        # Initialize components
         from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn
+        
+        # Initialize components
         explorer = DriveExplorer()
-        display = DriveDisplayManager(console)
+        display = DriveDisplayManager(_console())
         
         with Progress(
             SpinnerColumn(),
@@ -417,7 +436,7 @@ def full_scan(cache, force):
             BarColumn(),
             TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
             TimeElapsedColumn(),
-            console=console,
+            console=_console(),
         ) as progress:
             
             task = progress.add_task("Initializing scan...", total=100)
@@ -452,15 +471,18 @@ def full_scan(cache, force):
                 for file_type, data in workspace_analysis['workspace_types'].items():
                     rprint(f"  • {file_type.replace('google_', '').title()}: {data['count']:,} files")
         
+        # Largest folders and files, gathered in one pass over the items
+        analytics = explorer.compute_analytics(structure, file_limit=10, folder_limit=10)
+        
         # Show largest folders with calculated sizes
         if structure.total_folders > 0:
             rprint("\n[bold cyan]📁 Largest Folders (by calculated size):[/bold cyan]")
-            largest_folders = explorer.find_largest_folders(structure, limit=10)
+            largest_folders = analytics.largest_folders
             if largest_folders:
                 display.display_table(
                     largest_folders,
                     title="🔥 Top 10 Largest Folders",
-                    sort_by=SortBy.SIZE,
+                    sort_by=None,  # Already largest first
                     limit=10
                 )
             else:
@@ -468,12 +490,12 @@ def full_scan(cache, force):
         
         # Show largest files
         rprint("\n[bold cyan]📄 Largest Files:[/bold cyan]")
-        largest_files = explorer.find_largest_files(structure, limit=10)
+        largest_files = analytics.largest_files
         if largest_files:
             display.display_table(
                 largest_files,
                 title="🔥 Top 10 Largest Files",
-                sort_by=SortBy.SIZE,
+                sort_by=None,  # Already largest first
                 limit=10
             )
         
@@ -498,20 +520,20 @@ def full_scan(cache, force):
         elif "network" in error_str or "connection" in error_str:
             rprint("[yellow]💡 Network issues detected. Check your internet connection.[/yellow]")
         
-        import traceback
-        if click.get_current_context().find_root().params.get('verbose'):
+        if ctx.obj.get('verbose'):
             rprint(f"[red]{traceback.format_exc()}[/red]")
 
 
 @main.command()
 @click.option('--limit', '-l', default=20, help='Number of largest items to show')
 @click.option('--type', 'item_type', type=click.Choice(['files', 'folders', 'both']), default='both', help='Show files, folders, or both')
-def largest(limit, item_type):
+@click.option('--cache/--no-cache', default=True, help='Use cached API responses if available')
+def largest(limit, item_type, cache):
     """Show the largest files and folders in your Drive."""
     try:
         rprint("[blue]🔍 Finding largest items...[/blue]")
         
-        display = DriveDisplayManager(console)
+        display = DriveDisplayManager(_console())
         
         # Check for complete cached structure first
         cached_structure = get_cache().get_structure()
@@ -527,7 +549,7 @@ def largest(limit, item_type):
                     display.display_table(
                         large_files,
                         title=f"🔥 Largest Files (Top {len(large_files)})",
-                        sort_by=SortBy.SIZE
+                        sort_by=None  # Already largest first
                     )
                 else:
                     rprint("[yellow]No large files found[/yellow]")
@@ -543,7 +565,7 @@ def largest(limit, item_type):
                     display.display_table(
                         large_folders,
                         title=f"🔥 Largest Folders (Top {len(large_folders)})",
-                        sort_by=SortBy.SIZE
+                        sort_by=None  # Already largest first
                     )
                 else:
                     rprint("[yellow]No folders with calculated sizes found[/yellow]")
@@ -554,33 +576,25 @@ def largest(limit, item_type):
         rprint("[yellow]No complete scan available. Showing sample data.[/yellow]")
         rprint("[dim]💡 Run 'gdrive-explorer full-scan' for complete analysis with folder sizes.[/dim]")
         
-        client = DriveClient()
-        
         # Get sample data
-        result = client.list_files(page_size=1000)
-        files = result.get('files', [])
-        
-        # Convert to DriveItem objects
-        from .models import DriveItem
-        items = []
-        for file_data in files:
-            try:
-                item = DriveItem.from_drive_api(file_data)
-                items.append(item)
-            except Exception:
-                continue
+        items = _load_items(DriveClient(), use_cache=cache)
         
-        # Separate files and folders
-        large_files = [item for item in items if not item.is_folder and item.size > 0]
-        large_folders = [item for item in items if item.is_folder]
+        # Separate files and folders in one pass
+        large_files = []
+        large_folders = []
+        for item in items:
+            if item.is_folder:
+                large_folders.append(item)
+            elif item.size > 0:
+                large_files.append(item)
         
         # Show files
         if item_type in ['files', 'both'] and large_files:
-            large_files.sort(key=lambda x: x.size, reverse=True)
+            top_files = heapq.nlargest(limit, large_files, key=attrgetter('size'))
             display.display_table(
-                large_files[:limit],
-                title=f"🔥 Largest Files (Top {min(limit, len(large_files))} - Sample)",
-                sort_by=SortBy.SIZE
+                top_files,
+                title=f"🔥 Largest Files (Top {len(top_files)} - Sample)",
+                sort_by=None  # Already largest first
             )
         
         # Show folders (note: without full scan, folder sizes aren't calculated)
@@ -602,28 +616,20 @@ def largest(limit, item_type):
 @main.command()
 @click.option('--depth', '-d', default=3, help='Tree depth to display')
 @click.option('--min-size', help='Minimum size to show (e.g., 10MB)')
-def tree(depth, min_size):
+@click.option('--cache/--no-cache', default=True, help='Use cached API responses if available')
+def tree(depth, min_size, cache):
     """Display your Google Drive as a folder tree."""
     try:
         rprint("[blue]🌳 Building folder tree...[/blue]")
         
         client = DriveClient()
-        display = DriveDisplayManager(console)
+        display = DriveDisplayManager(_console())
         
-        # Get data
-        result = client.list_files(page_size=1000)
-        files = result.get('files', [])
-        
-        # Convert to DriveItem objects and build structure
-        from .models import DriveItem, DriveStructure
+        # Build structure from every item in the Drive
         structure = DriveStructure()
         
-        for file_data in files:
-            try:
-                item = DriveItem.from_drive_api(file_data)
-                structure.add_item(item)
-            except Exception:
-                continue
+        for item in _load_items(client, all_pages=True, use_cache=cache):
+            structure.add_item(item)
         
         structure.build_hierarchy()
         
@@ -644,12 +650,13 @@ def tree(depth, min_size):
 
 
 @main.command()
-def summary():
+@click.option('--cache/--no-cache', default=True, help='Use cached API responses if available')
+def summary(cache):
     """Show summary statistics of your Google Drive."""
     try:
         rprint("[blue]📊 Analyzing Google Drive...[/blue]")
         
-        display = DriveDisplayManager(console)
+        display = DriveDisplayManager(_console())
         
         # Check for complete cached structure first
         cached_structure = get_cache().get_structure()
@@ -666,38 +673,44 @@ def summary():
         rprint("[yellow]No cached data available. Generating sample summary.[/yellow]")
         rprint("[dim]💡 Run 'gdrive-explorer full-scan' for complete analysis.[/dim]")
         
-        client = DriveClient()
-        
         # Get sample data for basic summary
-        result = client.list_files(page_size=1000)
-        files = result.get('files', [])
+        items = _load_items(DriveClient(), use_cache=cache)
         
-        # Basic analysis
-        total_items = len(files)
-        folders = [f for f in files if client.is_folder(f)]
-        regular_files = [f for f in files if not client.is_folder(f)]
-        total_size = sum(client.get_file_size(f) for f in regular_files)
+        # Basic analysis in a single pass
+        total_items = len(items)
+        folder_count = 0
+        workspace_count = 0
+        total_size = 0
+        
+        for item in items:
+            if item.is_folder:
+                folder_count += 1
+                continue
+            
+            total_size += item.size
+            
+            # Google Workspace files
+            if 'google-apps' in item.mime_type:
+                workspace_count += 1
         
-        # Google Workspace files
-        workspace_files = [f for f in regular_files if 'google-apps' in f.get('mimeType', '')]
+        file_count = total_items - folder_count
         
         # Create summary
         summary_text = f"""
 [bold cyan]📊 Google Drive Summary (Sample)[/bold cyan]
 
 [bold]Total Items:[/bold] {total_items:,} (sample of your Drive)
-[bold]Files:[/bold] {len(regular_files):,}
-[bold]Folders:[/bold] {len(folders):,}
+[bold]Files:[/bold] {file_count:,}
+[bold]Folders:[/bold] {folder_count:,}
 [bold]Total Size:[/bold] {format_file_size(total_size)} (files only)
-[bold]Google Workspace Files:[/bold] {len(workspace_files):,}
+[bold]Google Workspace Files:[/bold] {workspace_count:,}
 
 [bold yellow]Note:[/bold yellow] This is a sample analysis from recent files. 
 For complete Drive analysis with folder sizes, run: [bold]gdrive-explorer full-scan[/bold]
         """
         
-        from rich.panel import Panel
         panel = Panel(summary_text.strip(), title="Google Drive Statistics", border_style="blue")
-        console.print(panel)
+        _console().print(panel)
         
     except Exception as e:
         rprint(f"[red]Error generating summary: {e}[/red]")
@@ -708,7 +721,8 @@ For complete Drive analysis with folder sizes, run: [bold]gdrive-explorer full-s
 @click.option('--type', 'item_type', type=click.Choice(['files', 'folders', 'both']), default='both', help='Item type to search')
 @click.option('--min-size', help='Minimum size filter (e.g., 10MB)')
 @click.option('--limit', '-l', default=50, help='Maximum results to show')
-def search(pattern, item_type, min_size, limit):
+@click.option('--cache/--no-cache', default=True, help='Use cached API responses if available')
+def search(pattern, item_type, min_size, limit, cache):
     """Search for files and folders in your Google Drive."""
     try:
         if not pattern:
@@ -718,21 +732,14 @@ def search(pattern, item_type, min_size, limit):
         rprint(f"[blue]🔍 Searching for: '{pattern}'...[/blue]")
         
         client = DriveClient()
-        display = DriveDisplayManager(console)
+        display = DriveDisplayManager(_console())
         
-        # Get data
-        result = client.list_files(page_size=1000)
-        files = result.get('files', [])
+        # Let Drive narrow by type. Names are always matched locally below:
+        # Drive's "name contains" only matches word prefixes, so sending the
+        # pattern would drop mid-word matches such as 'hoto' in 'photo.jpg'
+        query = client.build_search_query(item_type=item_type)
         
-        # Convert to DriveItem objects
-        from .models import DriveItem
-        items = []
-        for file_data in files:
-            try:
-                item = DriveItem.from_drive_api(file_data)
-                items.append(item)
-            except Exception:
-                continue
+        items = _load_items(client, query=query, all_pages=True, use_cache=cache)
         
         # Create filters
         filters = FilterOptions()
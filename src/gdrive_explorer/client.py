@@ -1,19 +1,124 @@
 """Google Drive API client wrapper."""
 
 import time
+import json
 import random
+import hashlib
+import itertools
 import logging
-from typing import Dict, List, Optional, Any, Callable
-from googleapiclient.discovery import build
+import queue
+import sys
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait, FIRST_COMPLETED
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Callable, Iterator, Iterable, Sequence, Tuple, Union
+import httplib2
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.errors import HttpError
+from googleapiclient.model import JsonModel
 from google.oauth2.credentials import Credentials
 
 from .auth import get_authenticated_credentials
 from .config import get_config
+from .cache import get_cache
+from .utils import TokenBucket
+
+try:
+    import orjson
+except ImportError:  # Optional speedup, installed with the 'fast' extra
+    orjson = None  # type: ignore[assignment]
 
 
 logger = logging.getLogger(__name__)
 
+FOLDER_MIME_TYPE = sys.intern('application/vnd.google-apps.folder')
+
+# Complete file metadata stored on a DriveItem
+FILE_FIELDS = (
+    "id, name, mimeType, size, parents, createdTime, modifiedTime, "
+    "webViewLink, ownedByMe, shared, trashed, starred"
+)
+LIST_FIELDS = f"nextPageToken, files({FILE_FIELDS})"
+
+# File metadata read by display-only commands (tables and trees). Scans
+# build DriveItems that are cached and reused, so they request FILE_FIELDS
+MINIMAL_FILE_FIELDS = "id, name, mimeType, size, parents, modifiedTime, shared, starred"
+DISPLAY_LIST_FIELDS = f"nextPageToken, files({MINIMAL_FILE_FIELDS})"
+
+# Maximum number of calls Drive accepts in one batch request
+BATCH_LIMIT = 100
+
+# Reasons Drive reports on 403 responses that are worth retrying
+QUOTA_ERROR_REASONS = frozenset({
+    'userRateLimitExceeded', 'rateLimitExceeded',
+    'quotaExceeded', 'dailyLimitExceeded',
+})
+
+# Seconds the request rate stays lowered after Drive reports a rate limit
+RATE_LIMIT_COOLDOWN = 30.0
+
+# Minimum seconds between progress lines printed by list_all_files
+PROGRESS_INTERVAL = 0.5
+
+# Lower bound for splitting listings by modification time
+DRIVE_LAUNCH_DATE = datetime(2012, 4, 24, tzinfo=timezone.utc)
+
+# Per-thread httplib2 connection pools, shared by every DriveClient
+_thread_connections = threading.local()
+
+
+def _get_connection_pool(timeout: int) -> httplib2.Http:
+    """Get the calling thread's keep-alive connection pool.
+    
+    httplib2.Http isn't thread-safe, but within one thread it can be shared,
+    so clients created one after another reuse the open TLS connection
+    instead of each paying a new handshake.
+    
+    Args:
+        timeout: Socket timeout in seconds
+        
+    Returns:
+        HTTP connection pool owned by the current thread
+    """
+    pools = getattr(_thread_connections, 'pools', None)
+    if pools is None:
+        pools = _thread_connections.pools = {}
+    
+    pool = pools.get(timeout)
+    if pool is None:
+        pool = pools[timeout] = httplib2.Http(timeout=timeout)
+    return pool
+
+
+def _intern_mime_types(files: Iterable[Dict[str, Any]]) -> None:
+    """Intern the MIME types of listed files in place.
+    
+    Pages repeat a handful of MIME types; interning them keeps one copy of
+    each and lets comparisons with FOLDER_MIME_TYPE match on identity.
+    """
+    intern = sys.intern
+    for file_data in files:
+        mime_type = file_data.get('mimeType')
+        if mime_type is not None:
+            file_data['mimeType'] = intern(mime_type)
+
+
+class _OrjsonModel(JsonModel):
+    """JsonModel that decodes response bodies with orjson."""
+    
+    def deserialize(self, content: Union[str, bytes]) -> Any:
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # Let the stock model deal with non-JSON bodies
+            return super().deserialize(content)
+        
+        if self._data_wrapper and isinstance(body, dict) and 'data' in body:
+            body = body['data']
+        return body
+
 
 class DriveClient:
     """Wrapper for Google Drive API with enhanced rate limiting and error handling."""
@@ -27,19 +132,135 @@ class DriveClient:
         if credentials is None:
             credentials = get_authenticated_credentials()
         
-        self.service = build('drive', 'v3', credentials=credentials)
         self.config = get_config()
         self.request_delay = self.config.api.request_delay
         self.max_retries = self.config.api.max_retries
+        self._credentials = credentials
         self._last_request_time = 0.0
         self._request_count = 0
+        self._rate_lock = threading.Lock()
+        self._rate_limiter = TokenBucket(
+            rate=1.0 / self.request_delay if self.request_delay > 0 else 0,
+            capacity=self.config.api.burst_requests
+        )
+        self._thread_local = threading.local()
+        
+        # In-memory LRU of file metadata, keyed by (file ID, fields)
+        self._metadata_cache: 'OrderedDict[Tuple[str, str], Tuple[float, Dict[str, Any]]]' = OrderedDict()
+        self._metadata_cache_size = self.config.api.metadata_cache_size
+        self._metadata_ttl = self.config.cache.ttl_hours * 3600
+        self._metadata_lock = threading.Lock()
+        
+        # googleapiclient.discovery pulls in most of the client library, so
+        # import it here rather than slowing down every CLI invocation
+        from googleapiclient.discovery import build
+        
+        # Drive v3 responses aren't wrapped in a 'data' envelope
+        model = _OrjsonModel(data_wrapper=False) if orjson else None
+        
+        # Build the service on this thread's transport so requests made here
+        # reuse one keep-alive connection instead of opening a second one.
+        # The Drive discovery document ships with the client library, so
+        # never fetch it over the network.
+        self.service = build('drive', 'v3', http=self._get_http(), model=model,
+                             static_discovery=True)
     
-    def _make_request_with_retry(self, request_func: Callable, *args, **kwargs) -> Any:
+    def _get_http(self) -> AuthorizedHttp:
+        """Get an authorized HTTP transport for the calling thread.
+        
+        httplib2 connections are not thread-safe, so each thread issuing
+        requests gets its own transport, layered over that thread's shared
+        connection pool. The thread that created the client shares its
+        transport with the service object.
+        
+        Returns:
+            Authorized HTTP transport owned by the current thread
+        """
+        http = getattr(self._thread_local, 'http', None)
+        if http is None:
+            http = AuthorizedHttp(
+                self._credentials,
+                http=_get_connection_pool(self.config.api.timeout)
+            )
+            self._thread_local.http = http
+        return http
+    
+    def _wait_for_rate_limit(self, request_count: int = 1) -> None:
+        """Block until the shared token bucket allows more requests.
+        
+        All threads draw from one bucket refilled at ``1 / request_delay``
+        tokens per second, allowing bursts of up to ``api.burst_requests``.
+        
+        Args:
+            request_count: API calls about to be made. Drive counts every
+                call in a batch against quota, so a batch takes one token
+                per call.
+        """
+        self._rate_limiter.acquire(request_count)
+        
+        with self._rate_lock:
+            self._last_request_time = time.time()
+            self._request_count += request_count
+    
+    @staticmethod
+    def _response_cache_key(method: str, **params: Any) -> str:
+        """Build a stable cache key for an API call and its parameters."""
+        if orjson is not None:
+            payload = orjson.dumps([method, params], option=orjson.OPT_SORT_KEYS)
+        else:
+            payload = json.dumps([method, params], sort_keys=True).encode('utf-8')
+        return hashlib.sha1(payload).hexdigest()
+    
+    @staticmethod
+    def _compute_backoff(attempt: int, cap: float) -> float:
+        """Get a full-jitter exponential backoff delay.
+        
+        Spreading retries uniformly over the whole window keeps concurrent
+        workers that were throttled together from retrying in lockstep.
+        
+        Args:
+            attempt: Zero-based retry attempt
+            cap: Maximum delay in seconds
+            
+        Returns:
+            Delay in seconds
+        """
+        return random.uniform(0, min(cap, 2 ** attempt))
+    
+    @staticmethod
+    def _is_quota_error(error: HttpError) -> bool:
+        """Check whether a 403 error means a rate or quota limit was hit.
+        
+        Uses the structured reasons googleapiclient parses from the error
+        body rather than formatting the whole error as a string.
+        """
+        details = getattr(error, 'error_details', None)
+        if not details:
+            # googleapiclient only fills error_details when the body has a
+            # message, so read the reasons from the body directly
+            try:
+                details = json.loads(error.content)['error']['errors']
+            except (ValueError, KeyError, TypeError):
+                details = None
+        
+        if isinstance(details, list):
+            for detail in details:
+                if isinstance(detail, dict) and detail.get('reason') in QUOTA_ERROR_REASONS:
+                    return True
+        
+        # Bodies without structured details still carry a readable reason
+        reason = getattr(error, 'reason', None) or ''
+        return reason in QUOTA_ERROR_REASONS or 'quota' in reason.lower()
+    
+    def _make_request_with_retry(self, request_func: Callable, *args,
+                                 request_count: int = 1, **kwargs) -> Any:
         """Make API request with exponential backoff retry logic.
         
         Args:
             request_func: Function to call that makes the API request
             *args, **kwargs: Arguments to pass to request_func
+            request_count: API calls each attempt makes (more than one for
+                batch requests), for rate limiting
             
         Returns:
             Result from successful API request
@@ -47,17 +268,10 @@ class DriveClient:
         Raises:
             HttpError: If all retries are exhausted
         """
-        # Rate limiting - ensure minimum delay between requests
-        current_time = time.time()
-        time_since_last = current_time - self._last_request_time
-        if time_since_last < self.request_delay:
-            sleep_time = self.request_delay - time_since_last
-            time.sleep(sleep_time)
-        
         for attempt in range(self.max_retries + 1):
             try:
-                self._last_request_time = time.time()
-                self._request_count += 1
+                # Rate limiting - ensure minimum delay between requests
+                self._wait_for_rate_limit(request_count)
                 
                 if attempt > 0:
                     logger.debug(f"API request attempt {attempt + 1}/{self.max_retries + 1}")
@@ -74,12 +288,10 @@ class DriveClient:
                 
                 # Handle different types of errors
                 if status_code == 429:  # Rate limit exceeded
+                    # Slow every worker down, not just this request
+                    self._rate_limiter.throttle(duration=RATE_LIMIT_COOLDOWN)
                     if attempt < self.max_retries:
-                        # Exponential backoff with jitter
-                        base_delay = min(60, 2 ** attempt)
-                        jitter = random.uniform(0.1, 0.3) * base_delay
-                        delay = base_delay + jitter
-                        
+                        delay = self._compute_backoff(attempt, cap=60)
                         logger.warning(f"Rate limit exceeded. Retrying in {delay:.1f} seconds...")
                         time.sleep(delay)
                         continue
@@ -89,8 +301,8 @@ class DriveClient:
                         
                 elif status_code in [500, 502, 503, 504]:  # Server errors
                     if attempt < self.max_retries:
-                        # Shorter delay for server errors
-                        delay = min(10, 2 ** attempt) + random.uniform(0.1, 0.5)
+                        # Shorter cap for server errors
+                        delay = self._compute_backoff(attempt, cap=10)
                         logger.warning(f"Server error {status_code}. Retrying in {delay:.1f} seconds...")
                         time.sleep(delay)
                         continue
@@ -99,8 +311,11 @@ class DriveClient:
                         raise
                         
                 elif status_code == 403:  # Forbidden - might be quota
-                    if "quota" in str(error).lower() and attempt < self.max_retries:
-                        delay = 60 + random.uniform(10, 30)  # Longer delay for quota issues
+                    is_quota_error = self._is_quota_error(error)
+                    if is_quota_error:
+                        self._rate_limiter.throttle(duration=RATE_LIMIT_COOLDOWN)
+                    if is_quota_error and attempt < self.max_retries:
+                        delay = random.uniform(30, 90)  # Longer delay for quota issues
                         logger.warning(f"Quota exceeded. Retrying in {delay:.1f} seconds...")
                         time.sleep(delay)
                         continue
@@ -116,7 +331,7 @@ class DriveClient:
             except Exception as e:
                 # For non-HTTP errors, retry with exponential backoff
                 if attempt < self.max_retries:
-                    delay = min(30, 2 ** attempt) + random.uniform(0.1, 1.0)
+                    delay = self._compute_backoff(attempt, cap=30)
                     logger.warning(f"Unexpected error: {e}. Retrying in {delay:.1f} seconds...")
                     time.sleep(delay)
                     continue
@@ -128,14 +343,19 @@ class DriveClient:
         raise Exception("Max retries exhausted")
     
     def list_files(self, page_size: int = 1000, page_token: Optional[str] = None,
-                   query: Optional[str] = None, fields: Optional[str] = None) -> Dict[str, Any]:
+                   query: Optional[str] = None, fields: Optional[str] = None,
+                   use_cache: bool = False) -> Dict[str, Any]:
         """List files from Google Drive.
         
         Args:
             page_size: Number of files to return per page (max 1000)
             page_token: Token for next page of results
             query: Search query to filter files
-            fields: Specific fields to return (default includes all metadata)
+            fields: Specific fields to return (default includes all metadata
+                stored on a DriveItem). Display-only callers can pass
+                ``DISPLAY_LIST_FIELDS`` for smaller pages.
+            use_cache: Serve the page from the local cache when possible and
+                store fresh responses there
             
         Returns:
             Dictionary containing files list and nextPageToken if more results exist
@@ -143,14 +363,7 @@ class DriveClient:
         Raises:
             HttpError: If API request fails
         """
-        if fields is None:
-            # Request comprehensive file metadata
-            fields = (
-                "nextPageToken, files("
-                "id, name, mimeType, size, parents, createdTime, modifiedTime, "
-                "webViewLink, ownedByMe, shared, trashed, starred"
-                ")"
-            )
+        fields = fields or LIST_FIELDS
         
         def _list_request():
             return self.service.files().list(
@@ -158,9 +371,142 @@ class DriveClient:
                 pageToken=page_token,
                 q=query,
                 fields=fields
-            ).execute()
+            ).execute(http=self._get_http())
+        
+        if not use_cache:
+            result = self._make_request_with_retry(_list_request)
+        else:
+            cache = get_cache()
+            cache_key = self._response_cache_key(
+                'files.list', page_size=page_size, page_token=page_token,
+                query=query, fields=fields
+            )
+            
+            result = cache.get_response(cache_key)
+            if result is None:
+                result = self._make_request_with_retry(_list_request)
+                cache.cache_response(cache_key, result)
+        
+        _intern_mime_types(result.get('files', ()))
+        
+        # Listed files carry the same metadata get_file_metadata returns
+        if fields == LIST_FIELDS:
+            self._remember_metadata(result.get('files', ()), FILE_FIELDS)
+        
+        return result
+    
+    def iter_files(self, query: Optional[str] = None, page_size: int = 1000,
+                   fields: Optional[str] = None, use_cache: bool = False,
+                   lookahead: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """Iterate over every file matching a query, page by page.
+        
+        Pages are prefetched in the background as described in ``iter_pages``.
+        
+        Args:
+            query: Search query to filter files
+            page_size: Number of files to request per page (max 1000)
+            fields: Specific fields to return (see ``list_files``)
+            use_cache: Serve pages from the local cache when possible
+            lookahead: Maximum pages buffered ahead of the caller
+                (defaults to ``api.prefetch_pages``)
+            
+        Yields:
+            File metadata dictionaries
+            
+        Raises:
+            HttpError: If API request fails
+        """
+        for files in self.iter_pages(query, page_size, fields, use_cache, lookahead):
+            yield from files
+    
+    def iter_pages(self, query: Optional[str] = None, page_size: int = 1000,
+                   fields: Optional[str] = None, use_cache: bool = False,
+                   lookahead: Optional[int] = None) -> Iterator[List[Dict[str, Any]]]:
+        """Iterate over the pages of files matching a query.
+        
+        A background thread follows ``nextPageToken`` and keeps up to
+        ``lookahead`` fetched pages buffered, so the network stays busy
+        while the caller processes earlier pages.
+        
+        Args:
+            query: Search query to filter files
+            page_size: Number of files to request per page (max 1000)
+            fields: Specific fields to return (see ``list_files``)
+            use_cache: Serve pages from the local cache when possible
+            lookahead: Maximum pages buffered ahead of the caller
+                (defaults to ``api.prefetch_pages``)
+            
+        Yields:
+            Lists of file metadata dictionaries, one per page
+            
+        Raises:
+            HttpError: If API request fails
+        """
+        if lookahead is None:
+            lookahead = self.config.api.prefetch_pages
+        
+        pages: queue.Queue = queue.Queue(maxsize=max(1, lookahead))
+        stop = threading.Event()
+        
+        def _put(entry: Tuple[Optional[List[Dict[str, Any]]], Optional[Exception]]) -> bool:
+            # Give up once the consumer has gone away
+            while not stop.is_set():
+                try:
+                    pages.put(entry, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        
+        def _fetch_pages() -> None:
+            page_token = None
+            try:
+                while True:
+                    result = self.list_files(page_size, page_token, query, fields, use_cache)
+                    if not _put((result.get('files', []), None)):
+                        return
+                    
+                    page_token = result.get('nextPageToken')
+                    if not page_token:
+                        break
+                
+                _put((None, None))
+            except Exception as e:
+                _put((None, e))
         
-        return self._make_request_with_retry(_list_request)
+        fetcher = threading.Thread(target=_fetch_pages, name='drive-page-prefetch', daemon=True)
+        fetcher.start()
+        
+        try:
+            while True:
+                files, error = pages.get()
+                if error is not None:
+                    raise error
+                if files is None:
+                    return
+                
+                yield files
+        finally:
+            stop.set()
+    
+    @staticmethod
+    def build_search_query(item_type: str = 'both') -> Optional[str]:
+        """Build a Drive ``q`` expression so type filtering happens server-side.
+        
+        Names aren't filtered here: Drive's ``name contains`` only matches
+        word prefixes, which would drop matches in the middle of a word.
+        
+        Args:
+            item_type: 'files', 'folders' or 'both'
+            
+        Returns:
+            Query string for list_files, or None if nothing to filter on
+        """
+        if item_type == 'folders':
+            return f"mimeType = '{FOLDER_MIME_TYPE}'"
+        if item_type == 'files':
+            return f"mimeType != '{FOLDER_MIME_TYPE}'"
+        return None
     
     def get_file_metadata(self, file_id: str, fields: Optional[str] = None) -> Dict[str, Any]:
         """Get metadata for a specific file.
@@ -175,19 +521,198 @@ class DriveClient:
         Raises:
             HttpError: If API request fails
         """
-        if fields is None:
-            fields = (
-                "id, name, mimeType, size, parents, createdTime, modifiedTime, "
-                "webViewLink, ownedByMe, shared, trashed, starred"
-            )
+        fields = fields or FILE_FIELDS
+        
+        cached = self._cached_metadata(file_id, fields)
+        if cached is not None:
+            return cached
         
         def _get_request():
             return self.service.files().get(
                 fileId=file_id,
                 fields=fields
-            ).execute()
+            ).execute(http=self._get_http())
         
-        return self._make_request_with_retry(_get_request)
+        result = self._make_request_with_retry(_get_request)
+        self._remember_metadata([result], fields)
+        return result
+    
+    def get_files_metadata_batch(self, file_ids: List[str],
+                                 fields: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """Get metadata for many files using batch requests.
+        
+        Up to ``BATCH_LIMIT`` lookups are sent in each HTTP request instead
+        of one request per file.
+        
+        Args:
+            file_ids: Google Drive file IDs
+            fields: Specific fields to return
+            
+        Returns:
+            Dictionary mapping file ID to metadata. Files that couldn't be
+            fetched (e.g. not found) are left out.
+            
+        Raises:
+            HttpError: If a batch request itself fails
+        """
+        fields = fields or FILE_FIELDS
+        
+        results: Dict[str, Dict[str, Any]] = {}
+        missing = []
+        for file_id in dict.fromkeys(file_ids):
+            cached = self._cached_metadata(file_id, fields)
+            if cached is not None:
+                results[file_id] = cached
+            else:
+                missing.append(file_id)
+        
+        for start in range(0, len(missing), BATCH_LIMIT):
+            chunk = missing[start:start + BATCH_LIMIT]
+            fetched = self._execute_metadata_batch(chunk, fields)
+            self._remember_metadata(fetched.values(), fields)
+            results.update(fetched)
+        
+        return results
+    
+    def _execute_metadata_batch(self, file_ids: List[str], fields: str) -> Dict[str, Dict[str, Any]]:
+        """Fetch metadata for up to ``BATCH_LIMIT`` files in one batch request."""
+        return self._execute_batch(
+            file_ids,
+            lambda file_id: self.service.files().get(fileId=file_id, fields=fields),
+            'metadata'
+        )
+    
+    def _execute_batch(self, request_ids: List[str],
+                       make_request: Callable[[str], Any],
+                       description: str) -> Dict[str, Any]:
+        """Send one API call per ID in a single batch request.
+        
+        Calls that fail with a rate limit or server error are sent again
+        in a smaller batch, up to ``max_retries`` times. Other failures are
+        logged and left out, so one bad ID doesn't fail the whole batch.
+        
+        Args:
+            request_ids: IDs to make calls for (at most ``BATCH_LIMIT``)
+            make_request: Builds the API request for an ID
+            description: What is being fetched, for log messages
+            
+        Returns:
+            Dictionary mapping ID to response for the calls that succeeded
+        """
+        results = {}
+        failed = {}
+        pending = list(request_ids)
+        
+        def _callback(request_id: str, response: Dict[str, Any],
+                      exception: Optional[HttpError]) -> None:
+            if exception is None:
+                results[request_id] = response
+            else:
+                failed[request_id] = exception
+        
+        def _send_batch(batch_ids: List[str]) -> None:
+            # A retried HTTP request starts over with a fresh batch, sending
+            # only the calls that haven't already succeeded
+            failed.clear()
+            batch_ids = [request_id for request_id in batch_ids if request_id not in results]
+            if not batch_ids:
+                return
+            
+            batch = self.service.new_batch_http_request(callback=_callback)
+            for request_id in batch_ids:
+                batch.add(make_request(request_id), request_id=request_id)
+            batch.execute(http=self._get_http())
+        
+        for attempt in range(self.max_retries + 1):
+            # Every call in the batch counts against quota
+            self._make_request_with_retry(_send_batch, pending, request_count=len(pending))
+            
+            pending = []
+            for request_id, error in failed.items():
+                if isinstance(error, HttpError) and error.resp.status in [429, 500, 502, 503, 504]:
+                    pending.append(request_id)
+                else:
+                    logger.warning(f"Could not fetch {description} for {request_id}: {error}")
+            
+            if not pending:
+                break
+            
+            if attempt < self.max_retries:
+                delay = self._compute_backoff(attempt, cap=60)
+                logger.warning(f"{len(pending)} batched {description} requests throttled. Retrying in {delay:.1f} seconds...")
+                time.sleep(delay)
+        else:
+            logger.error(f"Giving up on {description} for {len(pending)} items after {self.max_retries + 1} attempts")
+        
+        return results
+    
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _normalize_fields(fields: str) -> str:
+        """Canonicalize a field mask so equivalent masks share cache entries.
+        
+        Memoized, since the same handful of masks is normalized on every lookup.
+        """
+        if '(' in fields:
+            return ''.join(fields.split())
+        return ','.join(sorted(field.strip() for field in fields.split(',')))
+    
+    def _cached_metadata(self, file_id: str, fields: str) -> Optional[Dict[str, Any]]:
+        """Look up file metadata in the in-memory cache.
+        
+        Args:
+            file_id: Google Drive file ID
+            fields: Field mask the metadata was requested with
+            
+        Returns:
+            Cached metadata or None if not cached/expired
+        """
+        key = (file_id, self._normalize_fields(fields))
+        
+        with self._metadata_lock:
+            entry = self._metadata_cache.get(key)
+            if entry is None:
+                return None
+            
+            cached_at, metadata = entry
+            if time.time() - cached_at > self._metadata_ttl:
+                del self._metadata_cache[key]
+                return None
+            
+            self._metadata_cache.move_to_end(key)
+            return metadata
+    
+    def _remember_metadata(self, files: Iterable[Dict[str, Any]], fields: str) -> None:
+        """Store file metadata in the in-memory cache, evicting the oldest entries.
+        
+        Args:
+            files: File metadata dictionaries
+            fields: Field mask the metadata was requested with
+        """
+        if self._metadata_cache_size <= 0:
+            return
+        
+        fields = self._normalize_fields(fields)
+        now = time.time()
+        
+        with self._metadata_lock:
+            cache = self._metadata_cache
+            for file_data in files:
+                file_id = file_data.get('id')
+                if not file_id:
+                    continue
+                
+                key = (file_id, fields)
+                cache[key] = (now, file_data)
+                cache.move_to_end(key)
+            
+            while len(cache) > self._metadata_cache_size:
+                cache.popitem(last=False)
+    
+    def clear_metadata_cache(self) -> None:
+        """Drop all file metadata held in memory."""
+        with self._metadata_lock:
+            self._metadata_cache.clear()
     
     def get_request_stats(self) -> Dict[str, Any]:
         """Get statistics about API requests made.
@@ -199,56 +724,265 @@ class DriveClient:
             'total_requests': self._request_count,
             'request_delay': self.request_delay,
             'max_retries': self.max_retries,
-            'last_request_time': self._last_request_time
+            'last_request_time': self._last_request_time,
+            'metadata_cache_entries': len(self._metadata_cache)
         }
     
     def list_all_files(self, query: Optional[str] = None, 
-                       show_progress: bool = True) -> List[Dict[str, Any]]:
+                       show_progress: bool = True,
+                       shards: Optional[int] = None,
+                       use_cache: bool = False,
+                       page_size: int = 1000,
+                       page_callback: Optional[Callable[[List[Dict[str, Any]]], None]] = None,
+                       fields: Optional[str] = None
+                       ) -> List[Dict[str, Any]]:
         """List all files from Google Drive, handling pagination automatically.
         
+        Page tokens have to be followed one after another. With ``shards``
+        above 1 the listing is split into modification time ranges that are
+        paginated concurrently, at the cost of at least one extra request
+        per range, all drawing on the same quota.
+        
         Args:
             query: Search query to filter files
             show_progress: Whether to show progress information
+            shards: Number of time ranges to list in parallel
+                (defaults to ``api.list_shards``, which is 1: no sharding)
+            use_cache: Serve pages from the local cache when possible and
+                store fresh responses there
+            page_size: Number of files to request per page (max 1000)
+            page_callback: Called with each page as it arrives, one call at
+                a time. Pages are then left to the callback rather than
+                collected, so fetched files survive a later failure.
+            fields: Specific fields to return for each page (see ``list_files``)
             
         Returns:
-            List of all files matching the query
+            List of all files matching the query (empty with ``page_callback``)
             
         Raises:
             HttpError: If API request fails
         """
-        all_files = []
-        page_token = None
-        page_count = 0
+        if shards is None:
+            shards = self.config.api.list_shards
         
-        while True:
-            result = self.list_files(page_token=page_token, query=query)
-            files = result.get('files', [])
-            all_files.extend(files)
-            
-            page_count += 1
-            if show_progress:
-                print(f"Fetched page {page_count}, total files: {len(all_files)}")
+        shard_queries = self._shard_query(query, shards)
+        progress_lock = threading.Lock()
+        progress = {'pages': 0, 'files': 0, 'reported_at': 0.0}
+        
+        def _list_shard(shard_query: Optional[str]) -> List[List[Dict[str, Any]]]:
+            # Keep each page's list as-is and flatten once at the end
+            pages = []
+            page_token = None
             
-            page_token = result.get('nextPageToken')
-            if not page_token:
-                break
+            while True:
+                result = self.list_files(page_size=page_size, page_token=page_token,
+                                         query=shard_query, fields=fields,
+                                         use_cache=use_cache)
+                files = result.get('files', [])
+                if page_callback is None:
+                    pages.append(files)
+                else:
+                    with progress_lock:
+                        page_callback(files)
+                
+                if show_progress:
+                    with progress_lock:
+                        progress['pages'] += 1
+                        progress['files'] += len(files)
+                        # Throttle terminal writes, which are slow and serialize the shards
+                        now = time.monotonic()
+                        if now - progress['reported_at'] >= PROGRESS_INTERVAL:
+                            progress['reported_at'] = now
+                            print(f"Fetched page {progress['pages']}, total files: {progress['files']}")
+                
+                page_token = result.get('nextPageToken')
+                if not page_token:
+                    return pages
+        
+        if len(shard_queries) == 1:
+            pages = _list_shard(shard_queries[0])
+        else:
+            workers = min(len(shard_queries), self.config.api.max_workers)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                pages = list(itertools.chain.from_iterable(
+                    executor.map(_list_shard, shard_queries)
+                ))
+        
+        all_files = list(itertools.chain.from_iterable(pages))
         
         if show_progress:
             print(f"Completed: fetched {len(all_files)} files total")
         
         return all_files
     
-    def get_folder_children(self, folder_id: str) -> List[Dict[str, Any]]:
+    def _shard_query(self, query: Optional[str], shards: int) -> Sequence[Optional[str]]:
+        """Split a query into non-overlapping modification time ranges.
+        
+        The first and last ranges are open-ended, so every file matches
+        exactly one of the returned queries.
+        
+        Args:
+            query: Search query to split
+            shards: Number of ranges to split into
+            
+        Returns:
+            List of queries covering the same files as ``query``
+        """
+        if shards <= 1:
+            return [query]
+        
+        # Split up to midnight so the shard queries (and the cache keys
+        # derived from them) stay the same for the whole day
+        today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+        step = (today - DRIVE_LAUNCH_DATE) / shards
+        bounds: List[Optional[str]] = [
+            (DRIVE_LAUNCH_DATE + step * i).strftime('%Y-%m-%dT%H:%M:%SZ')
+            for i in range(1, shards)
+        ]
+        
+        shard_queries: List[str] = []
+        for lower, upper in zip([None] + bounds, bounds + [None]):
+            clauses = [f"({query})"] if query else []
+            if lower:
+                clauses.append(f"modifiedTime >= '{lower}'")
+            if upper:
+                clauses.append(f"modifiedTime < '{upper}'")
+            shard_queries.append(' and '.join(clauses))
+        
+        return shard_queries
+    
+    def get_folder_children(self, folder_id: str,
+                            use_cache: bool = False) -> List[Dict[str, Any]]:
         """Get all files and folders within a specific folder.
         
         Args:
             folder_id: Google Drive folder ID
+            use_cache: Serve the listing from the local cache when possible
             
         Returns:
             List of files/folders in the specified folder
         """
         query = f"'{folder_id}' in parents and trashed=false"
-        return self.list_all_files(query=query, show_progress=False)
+        # Folder listings are usually a single page, so don't shard them
+        return self.list_all_files(query=query, show_progress=False, shards=1,
+                                   use_cache=use_cache)
+    
+    def batch_get_folder_children(self, folder_ids: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """Get the contents of many folders using batch requests.
+        
+        Up to ``api.folder_batch_size`` folder listings are sent in each
+        HTTP request instead of one request per folder. Each listing in a
+        batch still takes its own rate-limit token, since Drive counts it
+        against quota. Folders with more than one page of children have the
+        remaining pages listed individually.
+        
+        Args:
+            folder_ids: Google Drive folder IDs
+            
+        Returns:
+            Dictionary mapping folder ID to its files and folders. Folders
+            that couldn't be listed are left out.
+            
+        Raises:
+            HttpError: If a batch request itself fails
+        """
+        batch_size = max(1, min(self.config.api.folder_batch_size, BATCH_LIMIT))
+        folder_ids = list(dict.fromkeys(folder_ids))
+        results = {}
+        
+        for start in range(0, len(folder_ids), batch_size):
+            chunk = folder_ids[start:start + batch_size]
+            pages = self._execute_batch(
+                chunk,
+                lambda folder_id: self.service.files().list(
+                    pageSize=1000,
+                    q=f"'{folder_id}' in parents and trashed=false",
+                    fields=LIST_FIELDS
+                ),
+                'folder listing'
+            )
+            
+            for folder_id, page in pages.items():
+                children = page.get('files', [])
+                _intern_mime_types(children)
+                
+                page_token = page.get('nextPageToken')
+                while page_token:
+                    result = self.list_files(
+                        page_token=page_token,
+                        query=f"'{folder_id}' in parents and trashed=false"
+                    )
+                    children.extend(result.get('files', []))
+                    page_token = result.get('nextPageToken')
+                
+                results[folder_id] = children
+        
+        return results
+    
+    def walk_tree(self, root_id: str, max_workers: Optional[int] = None,
+                  use_cache: bool = False) -> Iterator[Tuple[str, List[Dict[str, Any]]]]:
+        """Walk a folder tree, listing subfolders concurrently.
+        
+        Discovered folders are listed in batches of ``api.folder_batch_size``
+        through ``batch_get_folder_children``, and batches run on a thread
+        pool, so wall time tracks tree depth and each HTTP round trip
+        covers many folders. Requests still go through the shared rate
+        limiter.
+        
+        Args:
+            root_id: ID of the folder to start from
+            max_workers: Number of concurrent batches (defaults to ``api.max_workers``)
+            use_cache: Serve listings from the local cache when possible.
+                Cached listings are read one folder at a time.
+            
+        Yields:
+            ``(folder_id, children)`` tuples in completion order. Folders
+            whose listing failed are skipped.
+        """
+        if max_workers is None:
+            max_workers = self.config.api.max_workers
+        
+        def list_folders(folder_ids: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+            if use_cache:
+                return {folder_ids[0]: self.get_folder_children(folder_ids[0], True)}
+            return self.batch_get_folder_children(folder_ids)
+        
+        batch_size = 1 if use_cache else max(1, min(self.config.api.folder_batch_size, BATCH_LIMIT))
+        
+        seen = {root_id}
+        frontier = deque([root_id])
+        pending: Dict['Future[Dict[str, List[Dict[str, Any]]]]', List[str]] = {}
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            def submit_batches() -> None:
+                # Wait for full batches while every worker is busy
+                while frontier and (len(frontier) >= batch_size or len(pending) < max_workers):
+                    batch = [frontier.popleft() for _ in range(min(batch_size, len(frontier)))]
+                    pending[executor.submit(list_folders, batch)] = batch
+            
+            try:
+                submit_batches()
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    
+                    for future in done:
+                        del pending[future]
+                        listings = future.result()
+                        
+                        for folder_id, children in listings.items():
+                            for child in children:
+                                child_id = child.get('id')
+                                if child_id and self.is_folder(child) and child_id not in seen:
+                                    seen.add(child_id)
+                                    frontier.append(child_id)
+                            
+                            yield folder_id, children
+                    
+                    submit_batches()
+            finally:
+                # Stop queued listings if the caller stops early or a listing fails
+                for future in pending:
+                    future.cancel()
     
     def is_folder(self, file_metadata: Dict[str, Any]) -> bool:
         """Check if a file is actually a folder.
@@ -259,7 +993,7 @@ class DriveClient:
         Returns:
             True if the file is a folder
         """
-        return file_metadata.get('mimeType') == 'application/vnd.google-apps.folder'
+        return file_metadata.get('mimeType') == FOLDER_MIME_TYPE
     
     def get_file_size(self, file_metadata: Dict[str, Any]) -> int:
         """Get file size in bytes, handling Google Workspace files.
@@ -280,6 +1014,27 @@ class DriveClient:
         except (ValueError, TypeError):
             return 0
     
+    def get_file_sizes_bulk(self, files: Iterable[Dict[str, Any]]) -> List[int]:
+        """Get the sizes of many files at once.
+        
+        Converts every size in a single comprehension and only drops back to
+        per-file handling if some size is malformed, so totals over large
+        listings don't pay a method call per file.
+        
+        Args:
+            files: File metadata from Drive API
+            
+        Returns:
+            File sizes in bytes, in the same order (0 for Google Workspace files)
+        """
+        files = files if isinstance(files, list) else list(files)
+        
+        try:
+            return [int(size) if (size := file_data.get('size')) is not None else 0
+                    for file_data in files]
+        except (ValueError, TypeError):
+            return [self.get_file_size(file_data) for file_data in files]
+    
     def test_connection(self) -> bool:
         """Test the connection to Google Drive API.
         
@@ -288,7 +1043,7 @@ class DriveClient:
         """
         try:
             # Try to get basic info about the user's Drive
-            result = self.service.about().get(fields="user").execute()
+            result = self.service.about().get(fields="user").execute(http=self._get_http())
             return 'user' in result
         except Exception as e:
             print(f"Connection test failed: {e}")
@@ -1,27 +1,65 @@
 """Configuration management for Google Drive Explorer."""
 
 import os
+import copy
+from functools import cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 import yaml
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
+try:
+    # libyaml-backed loader is much faster when PyYAML was built with it
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
-class APIConfig(BaseModel):
+
+# Parsed settings files keyed by (resolved path, modification time)
+_parsed_config_files: Dict[Tuple[str, float], Dict[str, Any]] = {}
+
+# Environment variables overriding (section, key) in the configuration
+_ENV_OVERRIDES = (
+    ('GDRIVE_EXPLORER_CREDENTIALS_FILE', ('auth', 'credentials_file')),
+    ('GDRIVE_EXPLORER_TOKEN_FILE', ('auth', 'token_file')),
+    ('GDRIVE_EXPLORER_LOG_LEVEL', ('logging', 'level')),
+    ('GDRIVE_EXPLORER_CACHE_ENABLED', ('cache', 'enabled')),
+    ('GDRIVE_EXPLORER_SHOW_PROGRESS', ('display', 'show_progress')),
+    ('GDRIVE_EXPLORER_USE_COLORS', ('display', 'use_colors')),
+)
+_ENV_BOOLEANS = {'true': True, 'false': False}
+
+
+class _Settings(BaseModel):
+    """Base for configuration sections.
+    
+    Loaded configuration is shared process-wide through ``get_config()``,
+    so sections are frozen; unknown keys in settings.yaml are ignored.
+    """
+    model_config = ConfigDict(frozen=True, extra='ignore')
+
+
+class APIConfig(_Settings):
     """Google Drive API configuration."""
     request_delay: float = 0.1
+    burst_requests: int = 10
     max_retries: int = 3
     timeout: int = 30
     page_size: int = 1000
+    max_workers: int = 8
+    prefetch_pages: int = 2
+    list_shards: int = 1
+    metadata_cache_size: int = 10000
+    folder_batch_size: int = 25
 
 
-class AuthConfig(BaseModel):
+class AuthConfig(_Settings):
     """Authentication configuration."""
     credentials_file: str = "config/credentials.json"
     token_file: str = "config/token.pickle"
 
 
-class CacheConfig(BaseModel):
+class CacheConfig(_Settings):
     """Caching configuration."""
     enabled: bool = True
     ttl_hours: int = 24
@@ -29,7 +67,7 @@ class CacheConfig(BaseModel):
     database_path: str = "data/cache.db"
 
 
-class DisplayConfig(BaseModel):
+class DisplayConfig(_Settings):
     """Display configuration."""
     default_format: str = "table"
     max_items: int = 1000
@@ -38,21 +76,21 @@ class DisplayConfig(BaseModel):
     human_readable_sizes: bool = True
 
 
-class ExportConfig(BaseModel):
+class ExportConfig(_Settings):
     """Export configuration."""
     default_format: str = "csv"
     include_metadata: bool = True
     date_format: str = "%Y-%m-%d %H:%M:%S"
 
 
-class LoggingConfig(BaseModel):
+class LoggingConfig(_Settings):
     """Logging configuration."""
     level: str = "INFO"
     file: str = "gdrive-explorer.log"
     max_size_mb: int = 10
 
 
-class Config(BaseModel):
+class Config(_Settings):
     """Main configuration class."""
     api: APIConfig = Field(default_factory=APIConfig)
     auth: AuthConfig = Field(default_factory=AuthConfig)
@@ -89,8 +127,7 @@ class ConfigManager:
         # Load from YAML file if it exists
         if Path(self.config_file).exists():
             try:
-                with open(self.config_file, 'r') as f:
-                    config_data = yaml.safe_load(f) or {}
+                config_data = self._read_config_file()
             except Exception as e:
                 print(f"Warning: Failed to load config file {self.config_file}: {e}")
         
@@ -101,6 +138,24 @@ class ConfigManager:
         self._config = Config(**config_data)
         return self._config
     
+    def _read_config_file(self) -> Dict[str, Any]:
+        """Parse the YAML config file, reusing an earlier parse if it hasn't changed.
+        
+        Returns:
+            Configuration data from the file (a copy safe to modify)
+        """
+        path = Path(self.config_file).resolve()
+        key = (str(path), path.stat().st_mtime)
+        
+        parsed = _parsed_config_files.get(key)
+        if parsed is None:
+            with open(path, 'r') as f:
+                parsed = yaml.load(f, Loader=_YamlLoader) or {}
+            _parsed_config_files[key] = parsed
+        
+        # Environment overrides are applied in place, so hand out a copy
+        return copy.deepcopy(parsed)
+    
     def _apply_env_overrides(self, config_data: Dict[str, Any]) -> Dict[str, Any]:
         """Apply environment variable overrides to configuration.
         
@@ -110,32 +165,16 @@ class ConfigManager:
         Returns:
             Configuration data with environment overrides applied
         """
-        # Map environment variables to configuration paths
-        env_mapping = {
-            'GDRIVE_EXPLORER_CREDENTIALS_FILE': ['auth', 'credentials_file'],
-            'GDRIVE_EXPLORER_TOKEN_FILE': ['auth', 'token_file'],
-            'GDRIVE_EXPLORER_LOG_LEVEL': ['logging', 'level'],
-            'GDRIVE_EXPLORER_CACHE_ENABLED': ['cache', 'enabled'],
-            'GDRIVE_EXPLORER_SHOW_PROGRESS': ['display', 'show_progress'],
-            'GDRIVE_EXPLORER_USE_COLORS': ['display', 'use_colors'],
-        }
-        
-        for env_var, config_path in env_mapping.items():
-            value = os.environ.get(env_var)
-            if value is not None:
-                # Navigate to the correct nested dictionary
-                current = config_data
-                for key in config_path[:-1]:
-                    if key not in current:
-                        current[key] = {}
-                    current = current[key]
-                
-                # Set the value, converting boolean strings
-                final_key = config_path[-1]
-                if value.lower() in ('true', 'false'):
-                    current[final_key] = value.lower() == 'true'
-                else:
-                    current[final_key] = value
+        env = os.environ
+        
+        for env_var, (section, key) in _ENV_OVERRIDES:
+            value = env.get(env_var)
+            if value is None:
+                continue
+            
+            # Set the value, converting boolean strings
+            section_data = config_data.setdefault(section, {})
+            section_data[key] = _ENV_BOOLEANS.get(value.lower(), value)
         
         return config_data
     
@@ -156,7 +195,10 @@ class ConfigManager:
             Reloaded configuration object
         """
         self._config = None
-        return self.load_config()
+        config = self.load_config()
+        # Drop the memoized module-level accessor so it sees the new object
+        get_config.cache_clear()
+        return config
     
     def get_credentials_path(self) -> Path:
         """Get the full path to the credentials file.
@@ -186,26 +228,21 @@ class ConfigManager:
         return Path(config.cache.database_path).resolve()
 
 
-# Global configuration manager instance
-_config_manager: Optional[ConfigManager] = None
-
-
+@cache
 def get_config_manager() -> ConfigManager:
     """Get the global configuration manager instance.
     
     Returns:
         Global configuration manager
     """
-    global _config_manager
-    if _config_manager is None:
-        _config_manager = ConfigManager()
-    return _config_manager
+    return ConfigManager()
 
 
+@cache
 def get_config() -> Config:
     """Get the current configuration.
     
     Returns:
         Current configuration object
     """
-    return get_config_manager().get_config()
\ No newline at end of file
+    return get_config_manager().get_config()
@@ -1,18 +1,21 @@
 """Rich CLI output formatting and display utilities."""
 
+import re
 import math
+import heapq
 from datetime import datetime
-from typing import List, Dict, Any, Optional, Union
+from functools import lru_cache
+from itertools import islice
+from operator import attrgetter
+from typing import List, Dict, Any, Optional, Union, Callable
 from enum import Enum
 
 from rich.console import Console
 from rich.table import Table
 from rich.tree import Tree
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
+from rich.style import Style
 from rich.text import Text
-from rich.align import Align
-from rich import print as rprint
 
 from .models import DriveItem, DriveStructure, ItemType
 from .utils import format_file_size
@@ -36,9 +39,85 @@ class DisplayFormat(str, Enum):
     COMPACT = "compact"
 
 
+# Row icons, looked up by item type, then full MIME type, then MIME prefix,
+# then keywords anywhere in the MIME type
+_ICON_BY_TYPE = {
+    ItemType.FOLDER: "📁",
+    ItemType.GOOGLE_DOC: "📄",
+    ItemType.GOOGLE_SHEET: "📊",
+    ItemType.GOOGLE_SLIDE: "📋",
+    ItemType.GOOGLE_FORM: "📝",
+    ItemType.GOOGLE_DRAWING: "🎨",
+}
+_ICON_BY_MIME_TYPE = {
+    "application/pdf": "📕",
+}
+_ICON_BY_MIME_PREFIX = {
+    "image": "🖼️",
+    "video": "🎥",
+    "audio": "🎵",
+}
+# Catches less common spellings such as application/x-pdf
+_ICON_BY_MIME_KEYWORD = (
+    ("image", "🖼️"),
+    ("video", "🎥"),
+    ("audio", "🎵"),
+    ("pdf", "📕"),
+)
+_DEFAULT_ICON = "📄"
+
+
+def _name_key(item: DriveItem) -> str:
+    """Sort key ordering items by name, ignoring case."""
+    return item.name.lower()
+
+
+def _modified_key(item: DriveItem) -> datetime:
+    """Sort key ordering items by modification time, undated items oldest."""
+    return item.modified_time or datetime.min
+
+
+def _count_key(item: DriveItem) -> int:
+    """Sort key ordering folders by file count, files counting as zero."""
+    return item.file_count if item.is_folder else 0
+
+
+# Size thresholds for the compact list colors
+_GB = 1 << 30
+_MB = 1 << 20
+
+# Size colors for the compact list, parsed once rather than as markup per row
+_LARGE_SIZE_STYLE = Style.parse("red bold")  # > 1GB
+_MEDIUM_SIZE_STYLE = Style.parse("yellow")  # > 1MB
+_SMALL_SIZE_STYLE = Style.parse("green")
+_DIM_STYLE = Style(dim=True)
+
+# Sort keys by criteria, built once rather than per sort. Plain attribute
+# keys use attrgetter, which runs in C and saves a Python call per item.
+_SIZE_KEY = attrgetter('display_size')
+_SORT_KEYS: Dict[Optional[SortBy], Callable[[DriveItem], Any]] = {
+    SortBy.SIZE: _SIZE_KEY,
+    SortBy.NAME: _name_key,
+    SortBy.MODIFIED: _modified_key,
+    SortBy.TYPE: attrgetter('type', 'display_size'),
+    SortBy.COUNT: _count_key,
+}
+
+
+@lru_cache(maxsize=64)
+def _compile_name_pattern(pattern: str) -> re.Pattern:
+    """Compile a case-insensitive name filter, reusing earlier compilations."""
+    return re.compile(pattern, re.IGNORECASE)
+
+
 class FilterOptions:
     """Options for filtering displayed items."""
     
+    __slots__ = (
+        'min_size', 'max_size', 'item_types', 'include_folders', 'include_files',
+        'modified_after', 'modified_before', 'name_pattern', 'show_zero_size'
+    )
+    
     def __init__(self):
         self.min_size: Optional[int] = None
         self.max_size: Optional[int] = None
@@ -49,6 +128,20 @@ class FilterOptions:
         self.modified_before: Optional[datetime] = None
         self.name_pattern: Optional[str] = None
         self.show_zero_size: bool = True
+    
+    def accepts_all(self) -> bool:
+        """Check whether these options would let every item through."""
+        return (
+            self.include_folders
+            and self.include_files
+            and self.show_zero_size
+            and not self.item_types
+            and self.min_size is None
+            and self.max_size is None
+            and self.modified_after is None
+            and self.modified_before is None
+            and not self.name_pattern
+        )
 
 
 class DriveDisplayManager:
@@ -64,30 +157,22 @@ class DriveDisplayManager:
         self.config = get_config()
     
     def sort_items(self, items: List[DriveItem], 
-                   sort_by: SortBy = SortBy.SIZE, 
+                   sort_by: Optional[SortBy] = SortBy.SIZE, 
                    reverse: bool = True) -> List[DriveItem]:
         """Sort items by specified criteria.
         
         Args:
             items: List of DriveItem objects to sort
-            sort_by: Sorting criteria
+            sort_by: Sorting criteria (None keeps the current order)
             reverse: If True, sort in descending order
             
         Returns:
             Sorted list of items
         """
-        if sort_by == SortBy.SIZE:
-            return sorted(items, key=lambda x: x.display_size, reverse=reverse)
-        elif sort_by == SortBy.NAME:
-            return sorted(items, key=lambda x: x.name.lower(), reverse=reverse)
-        elif sort_by == SortBy.MODIFIED:
-            return sorted(items, key=lambda x: x.modified_time or datetime.min, reverse=reverse)
-        elif sort_by == SortBy.TYPE:
-            return sorted(items, key=lambda x: (x.type, x.display_size), reverse=reverse)
-        elif sort_by == SortBy.COUNT:
-            return sorted(items, key=lambda x: x.file_count if x.is_folder else 0, reverse=reverse)
-        else:
+        key = _SORT_KEYS.get(sort_by)
+        if key is None:
             return items
+        return sorted(items, key=key, reverse=reverse)
     
     def filter_items(self, items: List[DriveItem], 
                      filters: Optional[FilterOptions] = None) -> List[DriveItem]:
@@ -100,69 +185,129 @@ class DriveDisplayManager:
         Returns:
             Filtered list of items
         """
-        if not filters:
+        predicate = self._filter_predicate(filters)
+        if predicate is None:
             return items
+        return list(filter(predicate, items))
+    
+    def select_items(self, items: List[DriveItem],
+                     filters: Optional[FilterOptions] = None,
+                     sort_by: Optional[SortBy] = SortBy.SIZE,
+                     limit: Optional[int] = None) -> List[DriveItem]:
+        """Filter, sort and limit items in a single pass.
+        
+        Equivalent to ``sort_items(filter_items(items, filters), sort_by)[:limit]``,
+        but filtered items stream straight into the sort (or into a heap of
+        ``limit`` items), so no intermediate filtered list is built.
         
-        filtered = []
+        Args:
+            items: List of items to select from
+            filters: Filter criteria
+            sort_by: Sorting criteria, descending (None keeps the current order)
+            limit: Maximum number of items to return
+            
+        Returns:
+            Selected items in display order
+        """
+        predicate = self._filter_predicate(filters)
+        selected = items if predicate is None else filter(predicate, items)
+        key = _SORT_KEYS.get(sort_by)
         
-        for item in items:
+        if limit:
+            if key is None:
+                return list(islice(selected, limit))
+            return heapq.nlargest(limit, selected, key=key)
+        
+        if key is None:
+            return list(selected)
+        return sorted(selected, key=key, reverse=True)
+    
+    def _filter_predicate(self, filters: Optional[FilterOptions]
+                          ) -> Optional[Callable[[DriveItem], bool]]:
+        """Build a function testing items against filter criteria.
+        
+        Returns:
+            Predicate for ``filter()``, or None if every item passes
+        """
+        if not filters or filters.accepts_all():
+            return None
+        
+        # Read the options into locals once rather than per item
+        include_folders = filters.include_folders
+        include_files = filters.include_files
+        # Set membership instead of a list scan per item
+        item_types = frozenset(filters.item_types) if filters.item_types else None
+        min_size = filters.min_size
+        max_size = filters.max_size
+        show_zero_size = filters.show_zero_size
+        modified_after = filters.modified_after
+        modified_before = filters.modified_before
+        
+        # Only compute display sizes when a size filter needs them
+        check_size = min_size is not None or max_size is not None or not show_zero_size
+        
+        # Compile the name pattern once rather than per item
+        name_regex = None
+        if filters.name_pattern:
+            name_regex = _compile_name_pattern(filters.name_pattern)
+        
+        def passes(item: DriveItem) -> bool:
             # Type filtering
-            if not filters.include_folders and item.is_folder:
-                continue
-            if not filters.include_files and not item.is_folder:
-                continue
+            is_folder = item.is_folder
+            if not include_folders and is_folder:
+                return False
+            if not include_files and not is_folder:
+                return False
             
             # Item type filtering
-            if filters.item_types and item.type not in filters.item_types:
-                continue
+            if item_types and item.type not in item_types:
+                return False
             
             # Size filtering
-            if filters.min_size is not None and item.display_size < filters.min_size:
-                continue
-            if filters.max_size is not None and item.display_size > filters.max_size:
-                continue
-            
-            # Zero size filtering
-            if not filters.show_zero_size and item.display_size == 0:
-                continue
+            if check_size:
+                size = item.display_size
+                if min_size is not None and size < min_size:
+                    return False
+                if max_size is not None and size > max_size:
+                    return False
+                
+                # Zero size filtering
+                if not show_zero_size and size == 0:
+                    return False
             
             # Date filtering
-            if item.modified_time:
-                if filters.modified_after and item.modified_time < filters.modified_after:
-                    continue
-                if filters.modified_before and item.modified_time > filters.modified_before:
-                    continue
+            modified_time = item.modified_time
+            if modified_time:
+                if modified_after and modified_time < modified_after:
+                    return False
+                if modified_before and modified_time > modified_before:
+                    return False
             
             # Name pattern filtering
-            if filters.name_pattern:
-                import re
-                if not re.search(filters.name_pattern, item.name, re.IGNORECASE):
-                    continue
+            if name_regex and not name_regex.search(item.name):
+                return False
             
-            filtered.append(item)
+            return True
         
-        return filtered
+        return passes
     
     def display_table(self, items: List[DriveItem], 
                       title: str = "Google Drive Items",
-                      sort_by: SortBy = SortBy.SIZE,
+                      sort_by: Optional[SortBy] = SortBy.SIZE,
                       limit: Optional[int] = None,
-                      show_path: bool = False) -> None:
+                      show_path: bool = False,
+                      filters: Optional[FilterOptions] = None) -> None:
         """Display items in a rich table format.
         
         Args:
             items: Items to display
             title: Table title
-            sort_by: How to sort the items
+            sort_by: How to sort the items (None if they're already in order)
             limit: Maximum number of items to show
             show_path: Whether to show full path
+            filters: Filter criteria applied while selecting the rows
         """
-        # Sort items
-        sorted_items = self.sort_items(items, sort_by, reverse=True)
-        
-        # Apply limit
-        if limit:
-            sorted_items = sorted_items[:limit]
+        sorted_items = self.select_items(items, filters, sort_by, limit)
         
         # Create table
         table = Table(title=title, show_header=True, header_style="bold cyan")
@@ -178,7 +323,11 @@ class DriveDisplayManager:
         table.add_column("Modified", style="yellow", width=12)
         table.add_column("Details", style="dim", width=15)
         
+        # Relative dates are all measured from the same moment
+        now = datetime.now().astimezone()
+        
         # Add rows
+        add_row = table.add_row
         for item in sorted_items:
             # Name with icon
             name_text = self._get_item_icon(item) + " " + item.name
@@ -187,29 +336,23 @@ class DriveDisplayManager:
             type_text = self._format_item_type(item)
             
             # Size
-            if item.display_size > 0:
-                size_text = format_file_size(item.display_size)
-            elif item.is_google_workspace_file:
-                size_text = "G-Workspace"
-            else:
-                size_text = "-"
-            
-            # Path (if requested)
-            path_text = item.path if show_path else None
+            size_text = item.size_str
             
             # Modified date
-            modified_text = self._format_date(item.modified_time)
+            modified_text = self._format_date(item.modified_time, now)
             
             # Details (file count for folders, etc.)
             details_text = self._get_item_details(item)
             
-            # Add row
-            row = [name_text, type_text, size_text]
+            # Add row, with the path column if requested. Text cells skip the
+            # markup parsing Rich applies to plain strings (and keep names
+            # containing brackets intact); column styles still apply.
             if show_path:
-                row.append(path_text or "")
-            row.extend([modified_text, details_text])
-            
-            table.add_row(*row)
+                add_row(Text(name_text), Text(type_text), Text(size_text), Text(item.path or ""),
+                        Text(modified_text), Text(details_text))
+            else:
+                add_row(Text(name_text), Text(type_text), Text(size_text),
+                        Text(modified_text), Text(details_text))
         
         # Display table
         self.console.print(table)
@@ -243,52 +386,67 @@ class DriveDisplayManager:
             for file in structure.root_files[:10]:  # Limit root files display
                 if file.size >= min_size:
                     size_text = f" ({format_file_size(file.size)})" if show_size else ""
-                    files_node.add(f"{self._get_item_icon(file)} {file.name}{size_text}")
+                    files_node.add(Text(f"{self._get_item_icon(file)} {file.name}{size_text}"))
         
         self.console.print(tree)
     
     def _add_tree_node(self, parent_node, item: DriveItem, 
                        max_depth: int, min_size: int, 
                        show_size: bool, current_depth: int = 0) -> None:
-        """Recursively add tree nodes."""
+        """Add a folder and its largest descendants to the tree.
+        
+        Walks the folder with an explicit stack. Each folder's children are
+        split into folders and files once per scan, and only the handful
+        shown are picked out with a heap instead of sorting every child.
+        """
         if current_depth >= max_depth:
             return
         
-        # Format node label
-        size_text = ""
-        if show_size and item.display_size > 0:
-            size_text = f" ({format_file_size(item.display_size)})"
+        stack = [(parent_node.add(self._tree_node_label(item, show_size)), item, current_depth)]
         
-        details = ""
-        if item.is_folder and (item.file_count > 0 or item.folder_count > 0):
-            details = f" [{item.file_count} files, {item.folder_count} folders]"
-        
-        node_label = f"{self._get_item_icon(item)} {item.name}{size_text}{details}"
-        node = parent_node.add(node_label)
-        
-        # Add children if it's a folder
-        if item.is_folder and current_depth < max_depth - 1:
-            # Sort children by size
-            sorted_children = self.sort_items(item.children, SortBy.SIZE)
+        while stack:
+            node, item, depth = stack.pop()
             
-            # Add folders first
-            folders = [child for child in sorted_children if child.is_folder]
-            for child in folders[:10]:  # Limit display
+            # Add children if it's a folder
+            if not item.is_folder or depth >= max_depth - 1:
+                continue
+            
+            folders, files = item.partition_children()
+            
+            # Add the largest folders first. Their rich nodes are created now,
+            # so they keep their order whenever their own children are added.
+            for child in heapq.nlargest(10, folders, key=_SIZE_KEY):  # Limit display
                 if child.calculated_size and child.calculated_size >= min_size:
-                    self._add_tree_node(node, child, max_depth, min_size, show_size, current_depth + 1)
+                    child_node = node.add(self._tree_node_label(child, show_size))
+                    stack.append((child_node, child, depth + 1))
             
             # Add some files
-            files = [child for child in sorted_children if not child.is_folder]
             if files:
-                files_shown = 0
-                for child in files:
-                    if child.size >= min_size and files_shown < 5:
+                for child in heapq.nlargest(5, files, key=_SIZE_KEY):
+                    if child.size >= min_size:
                         file_size = f" ({format_file_size(child.size)})" if show_size else ""
-                        node.add(f"{self._get_item_icon(child)} {child.name}{file_size}")
-                        files_shown += 1
+                        node.add(Text(f"{self._get_item_icon(child)} {child.name}{file_size}"))
                 
                 if len(files) > 5:
-                    node.add(f"[dim]... and {len(files) - 5} more files[/dim]")
+                    node.add(Text(f"... and {len(files) - 5} more files", style=_DIM_STYLE))
+    
+    def _tree_node_label(self, item: DriveItem, show_size: bool) -> Text:
+        """Format the tree label for a folder or file.
+        
+        Labels are Text rather than str so Rich doesn't parse each one for
+        markup (and names containing brackets render as-is).
+        """
+        size_text = ""
+        if show_size:
+            display_size = item.display_size
+            if display_size > 0:
+                size_text = f" ({format_file_size(display_size)})"
+        
+        details = ""
+        if item.is_folder and (item.file_count > 0 or item.folder_count > 0):
+            details = f" [{item.file_count} files, {item.folder_count} folders]"
+        
+        return Text(f"{self._get_item_icon(item)} {item.name}{size_text}{details}")
     
     def display_summary(self, structure: DriveStructure) -> None:
         """Display summary statistics.
@@ -326,91 +484,97 @@ class DriveDisplayManager:
             item_type: "files", "folders", or "both"
             limit: Number of items to show
         """
+        # Keep only the top ``limit`` in a heap rather than sorting every item
         if item_type in ["files", "both"]:
-            files = [item for item in structure.all_items.values() 
-                    if not item.is_folder and item.size > 0]
-            files.sort(key=lambda x: x.size, reverse=True)
+            files = heapq.nlargest(
+                limit,
+                (item for item in structure.all_items.values()
+                 if not item.is_folder and item.size > 0),
+                key=attrgetter('size')
+            )
             
             if files:
                 self.display_table(
-                    files[:limit], 
-                    f"🔥 Largest Files (Top {min(limit, len(files))})",
-                    sort_by=SortBy.SIZE
+                    files, 
+                    f"🔥 Largest Files (Top {len(files)})",
+                    sort_by=None
                 )
         
         if item_type in ["folders", "both"]:
-            folders = [item for item in structure.all_items.values() 
-                      if item.is_folder and item.calculated_size and item.calculated_size > 0]
-            folders.sort(key=lambda x: x.calculated_size, reverse=True)
+            folders = heapq.nlargest(
+                limit,
+                (item for item in structure.all_items.values()
+                 if item.is_folder and item.calculated_size and item.calculated_size > 0),
+                key=attrgetter('calculated_size')
+            )
             
             if folders:
                 if item_type == "both":
                     self.console.print()  # Add spacing
                 
                 self.display_table(
-                    folders[:limit], 
-                    f"📁 Largest Folders (Top {min(limit, len(folders))})",
-                    sort_by=SortBy.SIZE
+                    folders, 
+                    f"📁 Largest Folders (Top {len(folders)})",
+                    sort_by=None
                 )
     
     def display_compact_list(self, items: List[DriveItem], 
                            title: str = "Items",
-                           limit: Optional[int] = None) -> None:
+                           limit: Optional[int] = None,
+                           sort_by: Optional[SortBy] = SortBy.SIZE,
+                           filters: Optional[FilterOptions] = None) -> None:
         """Display items in a compact list format.
         
         Args:
             items: Items to display
             title: List title  
             limit: Maximum items to show
+            sort_by: How to sort the items (None if they're already in order)
+            filters: Filter criteria applied while selecting the items
         """
-        sorted_items = self.sort_items(items, SortBy.SIZE, reverse=True)
-        if limit:
-            sorted_items = sorted_items[:limit]
+        # Filtered up front so the footer counts only matching items
+        matching = self.filter_items(items, filters)
+        sorted_items = self.select_items(matching, sort_by=sort_by, limit=limit)
         
         self.console.print(f"\n[bold cyan]{title}[/bold cyan]")
         self.console.print("─" * 60)
         
         for i, item in enumerate(sorted_items, 1):
             icon = self._get_item_icon(item)
-            size = format_file_size(item.display_size) if item.display_size > 0 else "-"
+            display_size = item.display_size
+            size = format_file_size(display_size) if display_size > 0 else "-"
             
             # Color code by size
-            if item.display_size > 1024**3:  # > 1GB
-                size_style = "red bold"
-            elif item.display_size > 1024**2:  # > 1MB  
-                size_style = "yellow"
+            if display_size > _GB:
+                size_style = _LARGE_SIZE_STYLE
+            elif display_size > _MB:
+                size_style = _MEDIUM_SIZE_STYLE
             else:
-                size_style = "green"
+                size_style = _SMALL_SIZE_STYLE
             
-            self.console.print(f"{i:2d}. {icon} {item.name:<40} [{size_style}]{size:>10}[/{size_style}]")
+            self.console.print(Text.assemble(f"{i:2d}. {icon} {item.name:<40} ", (f"{size:>10}", size_style)))
         
-        if len(sorted_items) < len(items):
-            self.console.print(f"\n[dim]... and {len(items) - len(sorted_items)} more items[/dim]")
+        if len(sorted_items) < len(matching):
+            self.console.print(f"\n[dim]... and {len(matching) - len(sorted_items)} more items[/dim]")
     
     def _get_item_icon(self, item: DriveItem) -> str:
         """Get emoji icon for item type."""
-        if item.is_folder:
-            return "📁"
-        elif item.type == ItemType.GOOGLE_DOC:
-            return "📄"
-        elif item.type == ItemType.GOOGLE_SHEET:
-            return "📊"
-        elif item.type == ItemType.GOOGLE_SLIDE:
-            return "📋"
-        elif item.type == ItemType.GOOGLE_FORM:
-            return "📝"
-        elif item.type == ItemType.GOOGLE_DRAWING:
-            return "🎨"
-        elif "image" in item.mime_type:
-            return "🖼️"
-        elif "video" in item.mime_type:
-            return "🎥"
-        elif "audio" in item.mime_type:
-            return "🎵"
-        elif "pdf" in item.mime_type:
-            return "📕"
-        else:
-            return "📄"
+        icon = _ICON_BY_TYPE.get(item.type)
+        if icon is not None:
+            return icon
+        
+        mime_type = item.mime_type
+        icon = _ICON_BY_MIME_TYPE.get(mime_type)
+        if icon is not None:
+            return icon
+        icon = _ICON_BY_MIME_PREFIX.get(mime_type.partition('/')[0])
+        if icon is not None:
+            return icon
+        
+        for keyword, icon in _ICON_BY_MIME_KEYWORD:
+            if keyword in mime_type:
+                return icon
+        return _DEFAULT_ICON
     
     def _format_item_type(self, item: DriveItem) -> str:
         """Format item type for display."""
@@ -421,26 +585,34 @@ class DriveDisplayManager:
         else:
             return "File"
     
-    def _format_date(self, date: Optional[datetime]) -> str:
-        """Format date for display."""
+    def _format_date(self, date: Optional[datetime],
+                     now: Optional[datetime] = None) -> str:
+        """Format date for display.
+        
+        Args:
+            date: Date to format relative to now
+            now: Current time, so callers formatting many rows can look it up
+                once (must be timezone-aware if ``date`` is)
+        """
         if not date:
             return "-"
         
-        now = datetime.now(date.tzinfo)
-        diff = now - date
+        if now is None or (now.tzinfo is None) != (date.tzinfo is None):
+            now = datetime.now(date.tzinfo)
+        days = (now - date).days
         
-        if diff.days == 0:
+        if days == 0:
             return "Today"
-        elif diff.days == 1:
+        elif days == 1:
             return "Yesterday"
-        elif diff.days < 7:
-            return f"{diff.days}d ago"
-        elif diff.days < 30:
-            return f"{diff.days // 7}w ago"
-        elif diff.days < 365:
-            return f"{diff.days // 30}mo ago"
+        elif days < 7:
+            return f"{days}d ago"
+        elif days < 30:
+            return f"{days // 7}w ago"
+        elif days < 365:
+            return f"{days // 30}mo ago"
         else:
-            return f"{diff.days // 365}y ago"
+            return f"{days // 365}y ago"
     
     def _get_item_details(self, item: DriveItem) -> str:
         """Get additional details for display."""
@@ -457,11 +629,24 @@ class DriveDisplayManager:
             return ""
 
 
+# Human-readable size strings, e.g. "10MB" or "1.5 GB" (matched upper-cased)
+_SIZE_PATTERN = re.compile(r'^(\d+(?:\.\d+)?)\s*([KMGT]?B?)$')
+
+# Units accepted by _SIZE_PATTERN; the trailing 'B' is optional
+_SIZE_MULTIPLIERS = {
+    'B': 1,
+    'K': 1024, 'KB': 1024,
+    'M': 1024**2, 'MB': 1024**2,
+    'G': 1024**3, 'GB': 1024**3,
+    'T': 1024**4, 'TB': 1024**4,
+}
+
+
 def parse_size_string(size_str: str) -> int:
     """Parse human-readable size string to bytes.
     
     Args:
-        size_str: Size string like "10MB", "1.5GB", etc.
+        size_str: Size string like "10MB", "1.5GB", "500K", etc.
         
     Returns:
         Size in bytes
@@ -469,8 +654,7 @@ def parse_size_string(size_str: str) -> int:
     size_str = size_str.upper().strip()
     
     # Extract number and unit
-    import re
-    match = re.match(r'^(\d+(?:\.\d+)?)\s*([KMGT]?B?)$', size_str)
+    match = _SIZE_PATTERN.match(size_str)
     if not match:
         raise ValueError(f"Invalid size format: {size_str}")
     
@@ -478,12 +662,4 @@ def parse_size_string(size_str: str) -> int:
     unit = match.group(2) or 'B'
     
     # Convert to bytes
-    multipliers = {
-        'B': 1,
-        'KB': 1024,
-        'MB': 1024**2,
-        'GB': 1024**3,
-        'TB': 1024**4
-    }
-    
-    return int(number * multipliers.get(unit, 1))
\ No newline at end of file
+    return int(number * _SIZE_MULTIPLIERS[unit])
@@ -1,12 +1,18 @@
 """Core exploration logic for Google Drive folder traversal."""
 
+import heapq
 import time
-from typing import Dict, List, Optional, Set, Callable
+from collections import Counter, deque
+from typing import Any, Dict, List, Optional, Set, Callable, Tuple
 from datetime import datetime
+from itertools import compress
+from operator import itemgetter
+from concurrent.futures import Future, ThreadPoolExecutor, wait, FIRST_COMPLETED
 import logging
+from googleapiclient.errors import HttpError
 
-from .client import DriveClient
-from .models import DriveItem, DriveStructure, ItemType
+from .client import DriveClient, LIST_FIELDS
+from .models import AnalyticsResult, DriveItem, DriveStructure, ItemType
 from .utils import ProgressTracker, RichProgressManager
 from .config import get_config
 from .cache import get_cache
@@ -50,12 +56,15 @@ class DriveExplorer:
         structure = DriveStructure()
         
         try:
-            # Step 1: Get all files from Drive
-            all_files = self._fetch_all_files(progress_callback)
-            logger.info(f"Found {len(all_files)} total items in Drive")
-            
-            # Step 2: Convert to DriveItem objects and build structure
-            self._build_structure(all_files, structure, progress_callback)
+            # Steps 1-2: Fetch pages in the background and convert each one
+            # to DriveItems as it arrives, overlapping parsing with requests
+            # Raw pages aren't kept, so only the DriveItems stay in memory
+            self._fetch_all_files(
+                progress_callback,
+                page_callback=lambda files: self._add_items(files, structure),
+                collect=False
+            )
+            logger.info(f"Found {len(structure.all_items)} total items in Drive")
             
             # Step 3: Build hierarchy and calculate sizes
             logger.info("Building folder hierarchy...")
@@ -167,6 +176,10 @@ class DriveExplorer:
     def _fetch_all_files_complete(self, progress_callback: Optional[Callable] = None) -> List[Dict]:
         """Fetch ALL files from Google Drive (not limited sample).
         
+        Pagination is sequential within a listing, so the client splits the
+        listing into modification time ranges that are paged concurrently
+        on its thread pool, within its shared request rate limit.
+        
         Args:
             progress_callback: Optional progress callback
             
@@ -174,94 +187,81 @@ class DriveExplorer:
             List of ALL file metadata dictionaries
         """
         all_files = []
-        page_token = None
-        page_count = 0
-        errors_encountered = 0
+        page_size = self.config.api.page_size
+        state: Dict[str, Any] = {'pages': 0, 'estimated_total': None}
         
         # Query to exclude trashed files but get everything else
         query = "trashed=false"
         
         logger.info("Fetching ALL files from Google Drive (complete scan)...")
         
-        try:
-            # First, estimate total by getting first page
-            first_result = self.client.list_files(
-                page_size=self.config.api.page_size,
-                query=query
-            )
+        def on_page(files: List[Dict]) -> None:
+            # The client calls this for one page at a time
+            all_files.extend(files)
+            state['pages'] += 1
             
-            estimated_total = None
-            if 'files' in first_result:
-                all_files.extend(first_result['files'])
-                page_count = 1
-                
+            estimated_total = state['estimated_total']
+            if estimated_total is None:
                 # Rough estimation for progress (Google doesn't give us total count)
-                if len(first_result['files']) == self.config.api.page_size:
+                if len(files) == page_size:
                     # Likely more pages, estimate based on typical Drive sizes
-                    estimated_total = self.config.api.page_size * 10  # Conservative estimate
+                    estimated_total = page_size * 10  # Conservative estimate
                 else:
-                    estimated_total = len(first_result['files'])
+                    estimated_total = len(files)
+            elif len(all_files) > estimated_total * 0.8:
+                # Update estimate if we're getting more than expected
+                estimated_total = int(len(all_files) * 1.5)
+            state['estimated_total'] = estimated_total
             
-            page_token = first_result.get('nextPageToken')
+            if progress_callback and estimated_total:
+                # Update progress (this is fetching phase, 0-30%)
+                current_progress = min(30, int((len(all_files) / estimated_total) * 30))
+                progress_callback(f"Fetched {len(all_files)} files...", current_progress, 100)
             
+            logger.debug(f"Fetched page {state['pages']}, total files: {len(all_files)}")
+        
+        try:
+            self.client.list_all_files(
+                query=query,
+                show_progress=False,
+                page_size=page_size,
+                page_callback=on_page,
+                fields=LIST_FIELDS
+            )
         except Exception as e:
-            logger.error(f"Failed to fetch initial page: {e}")
-            if "insufficient" in str(e).lower() or "permission" in str(e).lower():
-                raise PermissionError(f"Insufficient permissions to access Google Drive: {e}")
-            raise
+            if not all_files:
+                logger.error(f"Failed to fetch initial page: {e}")
+                if self._is_permission_error(e):
+                    raise PermissionError(f"Insufficient permissions to access Google Drive: {e}")
+                raise
+            
+            # Keep what was fetched rather than discarding the whole scan
+            logger.warning(f"Error fetching files after {state['pages']} pages: {e}")
+            logger.warning("Scan completed with errors. Some files may be missing.")
         
-        # Continue fetching all pages
-        while page_token:
-            try:
-                result = self.client.list_files(
-                    page_size=self.config.api.page_size,
-                    page_token=page_token,
-                    query=query
-                )
-                
-                files = result.get('files', [])
-                all_files.extend(files)
-                page_count += 1
-                
-                if progress_callback and estimated_total:
-                    # Update progress (this is fetching phase, 0-30%)
-                    current_progress = min(30, int((len(all_files) / estimated_total) * 30))
-                    progress_callback(f"Fetched {len(all_files)} files...", current_progress, 100)
-                
-                logger.debug(f"Fetched page {page_count}, total files: {len(all_files)}")
-                
-                page_token = result.get('nextPageToken')
-                
-                # Update estimate if we're getting more than expected
-                if estimated_total and len(all_files) > estimated_total * 0.8:
-                    estimated_total = int(len(all_files) * 1.5)
-                
-            except Exception as e:
-                errors_encountered += 1
-                logger.warning(f"Error fetching files on page {page_count}: {e}")
-                
-                # Handle specific permission errors
-                if "insufficient" in str(e).lower() or "permission" in str(e).lower():
-                    logger.warning(f"Permission denied for some files on page {page_count}")
-                    # Continue with next page if possible
-                    page_token = None
-                    break
-                elif "rate" in str(e).lower() or "quota" in str(e).lower():
-                    logger.warning(f"Rate limit hit, continuing with {len(all_files)} files")
-                    break
-                elif errors_encountered >= 3:
-                    logger.error(f"Too many errors ({errors_encountered}), stopping scan")
-                    break
-                else:
-                    # Try to continue with other pages
-                    page_token = None
-                    break
+        logger.info(f"Fetched {len(all_files)} files in {state['pages']} API calls")
+        return all_files
+    
+    @staticmethod
+    def _is_permission_error(error: Exception) -> bool:
+        """Check whether an error means Drive access was denied.
         
-        if errors_encountered > 0:
-            logger.warning(f"Scan completed with {errors_encountered} errors. Some files may be missing.")
+        Rate limit and quota errors also arrive as 403s; those are retried
+        with backoff by the client and aren't permission problems.
         
-        logger.info(f"Fetched {len(all_files)} files in {page_count} API calls")
-        return all_files
+        Args:
+            error: Exception raised while fetching
+            
+        Returns:
+            True if the error is an authorization failure
+        """
+        if isinstance(error, HttpError):
+            status = error.resp.status
+            return status == 401 or (status == 403 and not DriveClient._is_quota_error(error))
+        
+        # Errors that didn't come from the API only carry a message
+        message = str(error).lower()
+        return "insufficient" in message or "permission" in message
     
     def _build_complete_structure(self, 
                                 all_files: List[Dict], 
@@ -349,8 +349,13 @@ class DriveExplorer:
             if not folder.is_folder:
                 raise ValueError(f"Item {folder_id} is not a folder")
             
-            # Recursively scan contents
-            self._scan_folder_recursive(folder, max_depth, 0, progress_callback)
+            # Scan contents, listing subfolders in batches. The visited set
+            # only guards against cycles within one scan, so release it
+            # afterwards rather than letting it grow across scans.
+            try:
+                self._scan_folder_tree(folder, max_depth, progress_callback)
+            finally:
+                self._scanned_folders.clear()
             
             # Calculate final sizes
             folder.calculate_folder_size()
@@ -364,17 +369,26 @@ class DriveExplorer:
             logger.error(f"Error scanning folder {folder_id}: {e}")
             raise
     
-    def _fetch_all_files(self, progress_callback: Optional[Callable[[int, int], None]] = None) -> List[Dict]:
+    def _fetch_all_files(self, progress_callback: Optional[Callable[[int, int], None]] = None,
+                         page_callback: Optional[Callable[[List[Dict]], None]] = None,
+                         collect: bool = True) -> List[Dict]:
         """Fetch all files from Google Drive using pagination.
         
+        Pages are prefetched by the client in a background thread, so the
+        next request is already in flight while the current page is handed
+        to ``page_callback``.
+        
         Args:
             progress_callback: Optional progress callback
+            page_callback: Optional callback run on each page as it arrives
+            collect: Keep every page and return them. When False, pages are
+                only handed to ``page_callback`` and freed afterwards.
             
         Returns:
-            List of all file metadata dictionaries
+            List of all file metadata dictionaries (empty if not collecting)
         """
         all_files = []
-        page_token = None
+        file_count = 0
         page_count = 0
         
         # Query to exclude trashed files
@@ -382,37 +396,50 @@ class DriveExplorer:
         
         logger.info("Fetching all files from Google Drive...")
         
-        while True:
-            try:
-                result = self.client.list_files(
-                    page_size=self.config.api.page_size,
-                    page_token=page_token,
-                    query=query
-                )
-                
-                files = result.get('files', [])
-                all_files.extend(files)
+        try:
+            # The client's rate limiter paces the requests
+            for files in self.client.iter_pages(query=query, page_size=self.config.api.page_size,
+                                                fields=LIST_FIELDS):
+                if collect:
+                    all_files.extend(files)
+                file_count += len(files)
                 page_count += 1
                 
-                if progress_callback:
-                    progress_callback(len(all_files), len(all_files))
+                if page_callback:
+                    page_callback(files)
                 
-                logger.debug(f"Fetched page {page_count}, total files: {len(all_files)}")
-                
-                page_token = result.get('nextPageToken')
-                if not page_token:
-                    break
-                    
-                # Rate limiting
-                time.sleep(self.config.api.request_delay)
+                if progress_callback:
+                    progress_callback(file_count, file_count)
                 
-            except Exception as e:
-                logger.error(f"Error fetching files on page {page_count}: {e}")
-                raise
+                logger.debug(f"Fetched page {page_count}, total files: {file_count}")
+        except Exception as e:
+            logger.error(f"Error fetching files on page {page_count + 1}: {e}")
+            raise
         
-        logger.info(f"Fetched {len(all_files)} files in {page_count} API calls")
+        logger.info(f"Fetched {file_count} files in {page_count} API calls")
         return all_files
     
+    def _add_items(self, files: List[Dict], structure: DriveStructure) -> None:
+        """Convert a page of file metadata and add it to the structure.
+        
+        Args:
+            files: File metadata from one API page
+            structure: DriveStructure to populate
+        """
+        from_drive_api = DriveItem.from_drive_api
+        add_item = structure.add_item
+        scanned_at = datetime.now()
+        
+        for file_data in files:
+            if not file_data.get('id'):
+                logger.warning(f"Skipping file without ID: {file_data}")
+                continue
+            
+            try:
+                add_item(from_drive_api(file_data, scanned_at))
+            except Exception as e:
+                logger.warning(f"Error processing file {file_data['id']}: {e}")
+    
     def _build_structure(self, 
                         all_files: List[Dict], 
                         structure: DriveStructure,
@@ -426,80 +453,136 @@ class DriveExplorer:
         """
         logger.info("Converting API data to DriveItem objects...")
         
-        if self.config.display.show_progress:
-            progress = ProgressTracker(len(all_files), "Converting files")
+        # Entries without an ID can't be converted; drop them up front
+        # rather than failing inside the conversion loop
+        valid_files = [file_data for file_data in all_files if file_data.get('id')]
+        if len(valid_files) < len(all_files):
+            logger.warning(f"Skipping {len(all_files) - len(valid_files)} files without an ID")
         
-        for i, file_data in enumerate(all_files):
+        total = len(valid_files)
+        show_progress = self.config.display.show_progress
+        if show_progress:
+            progress = ProgressTracker(total, "Converting files")
+        
+        from_drive_api = DriveItem.from_drive_api
+        add_item = structure.add_item
+        scanned_at = datetime.now()
+        
+        for i, file_data in enumerate(valid_files, 1):
             try:
-                item = DriveItem.from_drive_api(file_data)
-                structure.add_item(item)
-                
-                if self.config.display.show_progress:
-                    progress.update()
-                
-                if progress_callback:
-                    progress_callback(i + 1, len(all_files))
-                    
+                add_item(from_drive_api(file_data, scanned_at))
             except Exception as e:
                 logger.warning(f"Error processing file {file_data.get('id', 'unknown')}: {e}")
                 continue
+            
+            if show_progress:
+                progress.update()
+            
+            if progress_callback:
+                progress_callback(i, total)
         
-        if self.config.display.show_progress:
+        if show_progress:
             progress.complete()
     
-    def _scan_folder_recursive(self, 
-                              folder: DriveItem, 
-                              max_depth: Optional[int],
-                              current_depth: int,
-                              progress_callback: Optional[Callable[[int, int], None]] = None) -> None:
-        """Recursively scan folder contents.
+    def _scan_folder_tree(self, 
+                          root: DriveItem, 
+                          max_depth: Optional[int],
+                          progress_callback: Optional[Callable[[int, int], None]] = None) -> None:
+        """Scan folder contents breadth-first using batched listings.
+        
+        Folders are listed through the client's batch endpoint, up to
+        ``api.folder_batch_size`` per HTTP request, with batches running
+        concurrently in a thread pool. Subfolders found in one response are
+        batched and sent as soon as there is a full batch or an idle
+        worker, without waiting for the rest of their level. Only the
+        calling thread mutates the DriveItem tree; the client's rate
+        limiter keeps the workers within the configured request rate.
         
         Args:
-            folder: Folder to scan
+            root: Folder to scan
             max_depth: Maximum depth to scan
-            current_depth: Current depth level
             progress_callback: Optional progress callback
         """
-        if folder.id in self._scanned_folders:
-            return  # Already scanned
+        batch_size = max(1, self.config.api.folder_batch_size)
+        max_workers = self.config.api.max_workers
+        from_drive_api = DriveItem.from_drive_api
         
-        if max_depth is not None and current_depth >= max_depth:
-            return  # Reached maximum depth
-        
-        logger.debug(f"Scanning folder: {folder.name} (depth {current_depth})")
-        
-        try:
-            # Get children of this folder
-            children_data = self.client.get_folder_children(folder.id)
+        def claim(folder: DriveItem, depth: int) -> bool:
+            if folder.id in self._scanned_folders:
+                return False  # Already scanned
+            if max_depth is not None and depth >= max_depth:
+                return False  # Reached maximum depth
             
-            for child_data in children_data:
-                try:
-                    child = DriveItem.from_drive_api(child_data)
-                    folder.add_child(child)
+            logger.debug(f"Scanning folder: {folder.name} (depth {depth})")
+            self._scanned_folders.add(folder.id)
+            return True
+        
+        # Breadth-first queue of (folder, depth) waiting to be listed; folders
+        # are claimed when enqueued, so each one is listed once even if
+        # reachable twice
+        queue = deque([(root, 0)] if claim(root, 0) else [])
+        
+        # In-flight batches, mapped to their folders by ID
+        pending: Dict['Future[Dict[str, List[Dict]]]', Dict[str, Tuple[DriveItem, int]]] = {}
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            
+            def submit_batches() -> None:
+                # Full batches go out right away; a partial one only while a
+                # worker would otherwise sit idle
+                while queue and (len(queue) >= batch_size or len(pending) < max_workers):
+                    folders: Dict[str, Tuple[DriveItem, int]] = {}
+                    while queue and len(folders) < batch_size:
+                        folder, depth = queue.popleft()
+                        folders[folder.id] = (folder, depth)
                     
-                    # If child is a folder, scan it recursively
-                    if child.is_folder:
-                        self._scan_folder_recursive(
-                            child, 
-                            max_depth, 
-                            current_depth + 1, 
-                            progress_callback
-                        )
+                    future = executor.submit(self.client.batch_get_folder_children, list(folders))
+                    pending[future] = folders
+            
+            submit_batches()
+            
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                
+                for future in done:
+                    folders = pending.pop(future)
                     
-                    self._total_items_found += 1
+                    try:
+                        listings = future.result()
+                    except Exception as e:
+                        logger.error(f"Error scanning folders: {e}")
+                        for other in pending:
+                            other.cancel()
+                        raise
                     
-                    if progress_callback:
-                        progress_callback(self._total_items_found, self._total_items_found)
+                    scanned_at = datetime.now()
+                    for folder_id, children_data in listings.items():
+                        folder, depth = folders.pop(folder_id)
+                        add_child = folder.add_child
                         
-                except Exception as e:
-                    logger.warning(f"Error processing child item: {e}")
-                    continue
-            
-            self._scanned_folders.add(folder.id)
-            
-        except Exception as e:
-            logger.error(f"Error scanning folder {folder.name}: {e}")
-            raise
+                        for child_data in children_data:
+                            try:
+                                child = from_drive_api(child_data, scanned_at)
+                                add_child(child)
+                                
+                                # If child is a folder, queue it for listing
+                                if child.is_folder and claim(child, depth + 1):
+                                    queue.append((child, depth + 1))
+                                
+                                self._total_items_found += 1
+                                
+                                if progress_callback:
+                                    progress_callback(self._total_items_found, self._total_items_found)
+                                    
+                            except Exception as e:
+                                logger.warning(f"Error processing child item: {e}")
+                                continue
+                    
+                    # Listings that failed individually were logged by the client
+                    for folder, _ in folders.values():
+                        logger.warning(f"Could not list folder {folder.name}; its contents are missing")
+                
+                submit_batches()
     
     def get_folder_tree(self, folder: DriveItem, max_depth: int = 3) -> Dict:
         """Get folder tree structure for display.
@@ -511,23 +594,101 @@ class DriveExplorer:
         Returns:
             Dictionary representing tree structure
         """
-        def build_tree(item: DriveItem, depth: int) -> Dict:
-            tree = {
+        def make_node(item: DriveItem, size: int) -> Dict:
+            return {
                 'name': item.name,
                 'type': item.type,
-                'size': item.display_size,
+                'size': size,
                 'file_count': item.file_count,
                 'folder_count': item.folder_count,
                 'children': []
             }
+        
+        root = make_node(folder, folder.display_size)
+        
+        # Walk with an explicit stack rather than recursion, so deep trees
+        # can't hit the interpreter's recursion limit. Each node is linked
+        # into its parent when created, so the stack order doesn't matter.
+        stack = [(folder, root, 0)]
+        while stack:
+            item, node, depth = stack.pop()
+            if depth >= max_depth or not item.is_folder:
+                continue
             
-            if depth < max_depth and item.is_folder:
-                for child in sorted(item.children, key=lambda x: x.display_size, reverse=True):
-                    tree['children'].append(build_tree(child, depth + 1))
+            # Read each child's size once, for both the sort and its node
+            sized = [(child.display_size, child) for child in item.children]
+            sized.sort(key=itemgetter(0), reverse=True)
             
-            return tree
+            children = node['children']
+            for child_size, child in sized:
+                child_node = make_node(child, child_size)
+                children.append(child_node)
+                stack.append((child, child_node, depth + 1))
         
-        return build_tree(folder, 0)
+        return root
+    
+    def compute_analytics(self, structure: DriveStructure,
+                          file_limit: int = 50, folder_limit: int = 50) -> AnalyticsResult:
+        """Gather the post-scan analytics in a single pass over all items.
+        
+        Produces the same results as ``find_largest_files``,
+        ``find_largest_folders``, ``find_empty_folders`` and
+        ``analyze_file_types``, but walks ``all_items`` once rather than
+        once per report.
+        
+        Args:
+            structure: DriveStructure to analyze
+            file_limit: Maximum number of largest files to return
+            folder_limit: Maximum number of largest folders to return
+            
+        Returns:
+            AnalyticsResult with every report filled in
+        """
+        # Min-heaps of (size, -position, item): the smallest kept entry is
+        # evicted first, and among equal sizes the later item goes first.
+        # Positions are unique, so items themselves are never compared.
+        largest_files: List[Tuple[int, int, DriveItem]] = []
+        largest_folders: List[Tuple[int, int, DriveItem]] = []
+        empty_folders = []
+        type_stats = self._empty_type_stats()
+        
+        for position, item in enumerate(structure.all_items.values()):
+            if item.is_folder:
+                if not item.children:
+                    empty_folders.append(item)
+                
+                calculated_size = item.calculated_size
+                if calculated_size and calculated_size > 0 and folder_limit > 0:
+                    entry = (calculated_size, -position, item)
+                    if len(largest_folders) < folder_limit:
+                        heapq.heappush(largest_folders, entry)
+                    elif entry > largest_folders[0]:
+                        heapq.heapreplace(largest_folders, entry)
+                continue
+            
+            size = item.size
+            if size > 0 and file_limit > 0:
+                entry = (size, -position, item)
+                if len(largest_files) < file_limit:
+                    heapq.heappush(largest_files, entry)
+                elif entry > largest_files[0]:
+                    heapq.heapreplace(largest_files, entry)
+            
+            stats = type_stats[item.type]
+            stats['count'] += 1
+            stats['total_size'] += size
+            stats['mime_types'].add(item.mime_type)
+        
+        def by_size(heap: List) -> List[DriveItem]:
+            heap.sort(reverse=True)
+            return [entry[2] for entry in heap]
+        
+        return AnalyticsResult(
+            largest_files=by_size(largest_files),
+            largest_folders=by_size(largest_folders),
+            empty_folders=empty_folders,
+            file_types=self._finish_type_stats(type_stats)
+        )
     
     def find_largest_files(self, structure: DriveStructure, limit: int = 50) -> List[DriveItem]:
         """Find the largest files in the drive.
@@ -539,11 +700,7 @@ class DriveExplorer:
         Returns:
             List of largest files sorted by size
         """
-        files = [item for item in structure.all_items.values() 
-                if not item.is_folder and item.size > 0]
-        
-        files.sort(key=lambda x: x.size, reverse=True)
-        return files[:limit]
+        return structure.files_by_size(min_size=1, limit=limit)
     
     def find_largest_folders(self, structure: DriveStructure, limit: int = 50) -> List[DriveItem]:
         """Find the largest folders in the drive.
@@ -555,11 +712,13 @@ class DriveExplorer:
         Returns:
             List of largest folders sorted by calculated size
         """
-        folders = [item for item in structure.all_items.values() 
-                  if item.is_folder and item.calculated_size and item.calculated_size > 0]
-        
-        folders.sort(key=lambda x: x.calculated_size, reverse=True)
-        return folders[:limit]
+        # Top-k selection rather than sorting every folder
+        return heapq.nlargest(
+            limit,
+            (item for item in structure.folders()
+             if item.calculated_size and item.calculated_size > 0),
+            key=lambda x: x.calculated_size or 0
+        )
     
     def find_empty_folders(self, structure: DriveStructure) -> List[DriveItem]:
         """Find empty folders in the drive.
@@ -570,13 +729,12 @@ class DriveExplorer:
         Returns:
             List of empty folders
         """
-        empty_folders = []
-        
-        for item in structure.all_items.values():
-            if item.is_folder and len(item.children) == 0:
-                empty_folders.append(item)
-        
-        return empty_folders
+        columns = structure.columns()
+        return [
+            item for item, child_count
+            in compress(zip(columns.items, columns.child_counts), columns.folder_mask)
+            if child_count == 0
+        ]
     
     def analyze_file_types(self, structure: DriveStructure) -> Dict[str, Dict]:
         """Analyze file types and their storage usage.
@@ -587,26 +745,52 @@ class DriveExplorer:
         Returns:
             Dictionary with file type statistics
         """
-        type_stats = {}
+        type_stats = self._empty_type_stats()
         
-        for item in structure.all_items.values():
-            if not item.is_folder:
-                mime_type = item.mime_type
-                file_type = item.type
-                
-                if file_type not in type_stats:
-                    type_stats[file_type] = {
-                        'count': 0,
-                        'total_size': 0,
-                        'mime_types': set()
-                    }
-                
-                type_stats[file_type]['count'] += 1
-                type_stats[file_type]['total_size'] += item.size
-                type_stats[file_type]['mime_types'].add(mime_type)
+        # Only the columns for files are read, not each DriveItem
+        columns = structure.columns()
+        file_mask = columns.file_mask
+        file_types = list(compress(columns.types, file_mask))
         
-        # Convert sets to lists for JSON serialization
-        for stats in type_stats.values():
-            stats['mime_types'] = list(stats['mime_types'])
+        # Counts and distinct MIME types are tallied in C; only the size
+        # totals need a Python loop, with one dict update per file
+        counts = Counter(file_types)
+        totals = dict.fromkeys(counts, 0)
+        for file_type, size in zip(file_types, compress(columns.sizes, file_mask)):
+            totals[file_type] += size
         
-        return type_stats
\ No newline at end of file
+        for file_type, count in counts.items():
+            stats = type_stats[file_type]
+            stats['count'] = count
+            stats['total_size'] = totals[file_type]
+        
+        for file_type, mime_type in set(zip(file_types, compress(columns.mime_types, file_mask))):
+            type_stats[file_type]['mime_types'].add(mime_type)
+        
+        return self._finish_type_stats(type_stats)
+    
+    @staticmethod
+    def _empty_type_stats() -> Dict[str, Dict]:
+        """Get a zeroed stats bucket for every item type.
+        
+        ItemType is closed, so every bucket exists up front and the tally
+        loops never have to check for a missing key.
+        """
+        return {
+            item_type.value: {'count': 0, 'total_size': 0, 'mime_types': set()}
+            for item_type in ItemType
+        }
+    
+    @staticmethod
+    def _finish_type_stats(type_stats: Dict[str, Dict]) -> Dict[str, Dict]:
+        """Drop unused buckets and make the stats JSON serializable."""
+        return {
+            file_type: {
+                'count': stats['count'],
+                'total_size': stats['total_size'],
+                # Convert sets to lists for JSON serialization
+                'mime_types': list(stats['mime_types'])
+            }
+            for file_type, stats in type_stats.items()
+            if stats['count']
+        }
\ No newline at end of file
@@ -1,10 +1,16 @@
 """Data models for Google Drive Explorer."""
 
+from array import array
+import sys
+from bisect import bisect_left, bisect_right
+from itertools import compress
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterable, Tuple
 from enum import Enum
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, PrivateAttr, validator
+
+from .utils import format_file_size
 
 
 class ItemType(str, Enum):
@@ -19,6 +25,37 @@ class ItemType(str, Enum):
     UNKNOWN = "unknown"
 
 
+# Google Workspace MIME types with a dedicated item type
+_MIME_TYPE_MAP: Dict[str, ItemType] = {
+    'application/vnd.google-apps.folder': ItemType.FOLDER,
+    'application/vnd.google-apps.document': ItemType.GOOGLE_DOC,
+    'application/vnd.google-apps.spreadsheet': ItemType.GOOGLE_SHEET,
+    'application/vnd.google-apps.presentation': ItemType.GOOGLE_SLIDE,
+    'application/vnd.google-apps.form': ItemType.GOOGLE_FORM,
+    'application/vnd.google-apps.drawing': ItemType.GOOGLE_DRAWING,
+}
+
+# Item types without a byte size of their own
+_WORKSPACE_TYPES = frozenset({
+    ItemType.GOOGLE_DOC,
+    ItemType.GOOGLE_SHEET,
+    ItemType.GOOGLE_SLIDE,
+    ItemType.GOOGLE_FORM,
+    ItemType.GOOGLE_DRAWING,
+})
+
+
+def _parse_api_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """Parse an RFC 3339 timestamp from the Drive API, or None if invalid."""
+    if not value:
+        return None
+    try:
+        # Python 3.11+ accepts the trailing 'Z' directly
+        return datetime.fromisoformat(value)
+    except (ValueError, AttributeError):
+        return None
+
+
 class DriveItem(BaseModel):
     """Represents a file or folder in Google Drive."""
     
@@ -47,6 +84,9 @@ class DriveItem(BaseModel):
     last_scanned: Optional[datetime] = Field(None, description="When this item was last scanned")
     scan_complete: bool = Field(default=False, description="Whether folder scan is complete")
     
+    # Children split into folders and files, with the list and length it was built from
+    _child_partition: Optional[Tuple[list, int, list, list]] = PrivateAttr(default=None)
+    
     class Config:
         """Pydantic configuration."""
         use_enum_values = True
@@ -62,6 +102,15 @@ class DriveItem(BaseModel):
         """Hash based on ID for use in sets and dicts."""
         return hash(self.id)
     
+    @validator('mime_type')
+    def intern_mime_type(cls, v: str) -> str:
+        """Share one string object per distinct MIME type.
+        
+        A drive has only a few dozen MIME types, so items loaded from the
+        cache point at the same strings instead of each holding a copy.
+        """
+        return sys.intern(v)
+    
     @validator('type', pre=True)
     def determine_type(cls, v, values):
         """Determine item type from MIME type if not explicitly set."""
@@ -79,18 +128,9 @@ class DriveItem(BaseModel):
         
         mime_type = values.get('mime_type', '')
         
-        if mime_type == 'application/vnd.google-apps.folder':
-            return ItemType.FOLDER
-        elif mime_type == 'application/vnd.google-apps.document':
-            return ItemType.GOOGLE_DOC
-        elif mime_type == 'application/vnd.google-apps.spreadsheet':
-            return ItemType.GOOGLE_SHEET
-        elif mime_type == 'application/vnd.google-apps.presentation':
-            return ItemType.GOOGLE_SLIDE
-        elif mime_type == 'application/vnd.google-apps.form':
-            return ItemType.GOOGLE_FORM
-        elif mime_type == 'application/vnd.google-apps.drawing':
-            return ItemType.GOOGLE_DRAWING
+        item_type = _MIME_TYPE_MAP.get(mime_type)
+        if item_type is not None:
+            return item_type
         elif 'google-apps' in mime_type:
             return ItemType.UNKNOWN
         else:
@@ -107,21 +147,31 @@ class DriveItem(BaseModel):
     @property
     def is_google_workspace_file(self) -> bool:
         """Check if this is a Google Workspace file (Docs, Sheets, etc.)."""
-        return self.type in [
-            ItemType.GOOGLE_DOC,
-            ItemType.GOOGLE_SHEET, 
-            ItemType.GOOGLE_SLIDE,
-            ItemType.GOOGLE_FORM,
-            ItemType.GOOGLE_DRAWING
-        ]
+        return self.type in _WORKSPACE_TYPES
     
     @property
     def display_size(self) -> int:
         """Get the size to display (calculated size for folders, actual size for files)."""
-        if self.is_folder and self.calculated_size is not None:
-            return self.calculated_size
+        # Only folders get a calculated size, so check it before the type
+        calculated_size = self.calculated_size
+        if calculated_size is not None and self.is_folder:
+            return calculated_size
         return self.size
     
+    @property
+    def size_str(self) -> str:
+        """Get the display size formatted for tables.
+        
+        Not cached on the item, since folder sizes change when they are
+        calculated; format_file_size memoizes the formatting itself.
+        """
+        display_size = self.display_size
+        if display_size > 0:
+            return format_file_size(display_size)
+        if self.type in _WORKSPACE_TYPES:
+            return "G-Workspace"
+        return "-"
+    
     @property
     def has_size(self) -> bool:
         """Check if this item contributes to storage usage."""
@@ -137,6 +187,28 @@ class DriveItem(BaseModel):
             self.children.append(child)
             child.path = f"{self.path}/{child.name}".lstrip("/")
     
+    def partition_children(self) -> Tuple[List['DriveItem'], List['DriveItem']]:
+        """Split children into folders and files.
+        
+        The split is cached until the children list is replaced or changes
+        length, so repeated renders of a scanned tree don't redo it.
+        
+        Returns:
+            Tuple of (child folders, child files) in their original order
+        """
+        children = self.children
+        cached = self._child_partition
+        if cached is not None and cached[0] is children and cached[1] == len(children):
+            return cached[2], cached[3]
+        
+        folders: List[DriveItem] = []
+        files: List[DriveItem] = []
+        for child in children:
+            (folders if child.is_folder else files).append(child)
+        
+        self._child_partition = (children, len(children), folders, files)
+        return folders, files
+    
     def calculate_folder_size(self) -> int:
         """Calculate total size of folder including all children recursively."""
         if not self.is_folder:
@@ -199,70 +271,116 @@ class DriveItem(BaseModel):
         }
     
     @classmethod
-    def from_drive_api(cls, api_data: Dict[str, Any]) -> 'DriveItem':
-        """Create DriveItem from Google Drive API response."""
-        # Parse timestamps
-        created_time = None
-        modified_time = None
+    def from_drive_api(cls, api_data: Dict[str, Any],
+                       scanned_at: Optional[datetime] = None) -> 'DriveItem':
+        """Create DriveItem from Google Drive API response.
         
-        if 'createdTime' in api_data:
-            try:
-                created_time = datetime.fromisoformat(api_data['createdTime'].replace('Z', '+00:00'))
-            except ValueError:
-                pass
+        Every field is parsed explicitly here, so the item is built with
+        ``model_construct`` rather than running validation a second time.
         
-        if 'modifiedTime' in api_data:
-            try:
-                modified_time = datetime.fromisoformat(api_data['modifiedTime'].replace('Z', '+00:00'))
-            except ValueError:
-                pass
+        Args:
+            api_data: File metadata from the Drive API
+            scanned_at: Scan time to record (defaults to now); pass one
+                timestamp when converting many items
+        """
+        get = api_data.get
         
         # Parse size
         size = 0
-        if 'size' in api_data:
+        size_str = get('size')
+        if size_str is not None:
             try:
-                size = int(api_data['size'])
+                size = int(size_str)
             except (ValueError, TypeError):
                 size = 0
         
-        # Determine item type from MIME type
-        mime_type = api_data.get('mimeType', '')
-        
-        if mime_type == 'application/vnd.google-apps.folder':
-            item_type = ItemType.FOLDER
-        elif mime_type == 'application/vnd.google-apps.document':
-            item_type = ItemType.GOOGLE_DOC
-        elif mime_type == 'application/vnd.google-apps.spreadsheet':
-            item_type = ItemType.GOOGLE_SHEET
-        elif mime_type == 'application/vnd.google-apps.presentation':
-            item_type = ItemType.GOOGLE_SLIDE
-        elif mime_type == 'application/vnd.google-apps.form':
-            item_type = ItemType.GOOGLE_FORM
-        elif mime_type == 'application/vnd.google-apps.drawing':
-            item_type = ItemType.GOOGLE_DRAWING
-        elif 'google-apps' in mime_type:
-            item_type = ItemType.UNKNOWN
-        else:
-            item_type = ItemType.FILE
-
-        return cls(
+        # Determine item type from MIME type. Listings intern it already;
+        # metadata from other sources is interned here
+        mime_type = sys.intern(get('mimeType', ''))
+        item_type = _MIME_TYPE_MAP.get(mime_type)
+        if item_type is None:
+            item_type = ItemType.UNKNOWN if 'google-apps' in mime_type else ItemType.FILE
+        
+        # Enum values are stored as plain strings (use_enum_values)
+        return cls.model_construct(
             id=api_data['id'],
-            name=api_data.get('name', 'Unknown'),
-            type=item_type,
+            name=get('name', 'Unknown'),
+            type=item_type.value,
             mime_type=mime_type,
             size=size,
-            parent_ids=api_data.get('parents', []),
-            created_time=created_time,
-            modified_time=modified_time,
-            is_owned_by_me=api_data.get('ownedByMe', True),
-            is_shared=api_data.get('shared', False),
-            is_starred=api_data.get('starred', False),
-            is_trashed=api_data.get('trashed', False),
-            web_view_link=api_data.get('webViewLink'),
-            last_scanned=datetime.now()
+            parent_ids=list(get('parents', ())),
+            created_time=_parse_api_timestamp(get('createdTime')),
+            modified_time=_parse_api_timestamp(get('modifiedTime')),
+            is_owned_by_me=get('ownedByMe', True),
+            is_shared=get('shared', False),
+            is_starred=get('starred', False),
+            is_trashed=get('trashed', False),
+            web_view_link=get('webViewLink'),
+            last_scanned=scanned_at or datetime.now()
+        )
+    
+    @classmethod
+    def from_drive_api_batch(cls, files: Iterable[Dict[str, Any]]) -> List['DriveItem']:
+        """Create DriveItems from a sequence of Google Drive API responses.
+        
+        Entries that can't be converted (e.g. missing an ID) are skipped.
+        """
+        items: List[DriveItem] = []
+        append = items.append
+        from_drive_api = cls.from_drive_api
+        scanned_at = datetime.now()
+        
+        for api_data in files:
+            try:
+                append(from_drive_api(api_data, scanned_at))
+            except (KeyError, TypeError, AttributeError):
+                continue
+        
+        return items
+
+
+@dataclass
+class ItemColumns:
+    """Per-item values of a DriveStructure laid out column by column.
+    
+    Row ``i`` of every column describes ``items[i]``. Sizes and child counts
+    are packed into typed arrays and the masks are bytes, so drive-wide
+    tallies can filter with ``itertools.compress`` and sum in C instead of
+    reading attributes off every DriveItem.
+    """
+    items: List[DriveItem]
+    sizes: array
+    child_counts: array
+    folder_mask: bytes
+    file_mask: bytes
+    types: List[ItemType]
+    mime_types: List[str]
+    
+    @classmethod
+    def from_items(cls, items: Iterable[DriveItem]) -> 'ItemColumns':
+        """Build the columns for a sequence of items."""
+        items = list(items)
+        folder_mask = bytes([item.is_folder for item in items])
+        return cls(
+            items=items,
+            sizes=array('q', [item.size for item in items]),
+            child_counts=array('q', [len(item.children) for item in items]),
+            folder_mask=folder_mask,
+            file_mask=bytes([not is_folder for is_folder in folder_mask]),
+            types=[item.type for item in items],
+            mime_types=[item.mime_type for item in items],
         )
 
 
+@dataclass
+class AnalyticsResult:
+    """Post-scan analytics gathered in one pass over a DriveStructure."""
+    largest_files: List[DriveItem] = field(default_factory=list)
+    largest_folders: List[DriveItem] = field(default_factory=list)
+    empty_folders: List[DriveItem] = field(default_factory=list)
+    file_types: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+
 class DriveStructure(BaseModel):
     """Represents the complete Google Drive structure."""
     
@@ -275,9 +393,44 @@ class DriveStructure(BaseModel):
     scan_timestamp: Optional[datetime] = Field(None, description="When scan was completed")
     scan_complete: bool = Field(default=False, description="Whether scan is complete")
     
+    # Files sorted largest first with their negated sizes, stamped with the
+    # scan version, item counts and total size it was built from
+    _file_size_index: Optional[Tuple[tuple, List[int], List[DriveItem]]] = PrivateAttr(default=None)
+    
+    # Bumped whenever items are added or the hierarchy is rebuilt; cached
+    # folder stats are reused only while it is unchanged
+    _scan_version: int = PrivateAttr(default=0)
+    _stats_cache: Optional[Tuple[tuple, Dict[str, Any]]] = PrivateAttr(default=None)
+    _columns: Optional[Tuple[tuple, ItemColumns]] = PrivateAttr(default=None)
+    
+    # Items grouped by their first parent ID (None for root items), filled in
+    # as items are added so build_hierarchy doesn't regroup every item. Valid
+    # only while _index_version matches _scan_version.
+    _items_by_parent: Dict[Optional[str], List[DriveItem]] = PrivateAttr(default_factory=dict)
+    _index_version: int = PrivateAttr(default=0)
+    _indexed_items: int = PrivateAttr(default=0)
+    
     def add_item(self, item: DriveItem) -> None:
         """Add an item to the structure."""
+        # Extend the parent index only while it is current; a replaced item
+        # would leave its old entry behind, so that forces a rebuild instead
+        index_current = (self._index_version == self._scan_version
+                         and self._indexed_items == len(self.all_items)
+                         and item.id not in self.all_items)
+        
         self.all_items[item.id] = item
+        self._scan_version += 1
+        
+        if index_current:
+            parent_ids = item.parent_ids
+            parent_id = parent_ids[0] if parent_ids else None
+            group = self._items_by_parent.get(parent_id)
+            if group is None:
+                self._items_by_parent[parent_id] = [item]
+            else:
+                group.append(item)
+            self._indexed_items += 1
+            self._index_version = self._scan_version
         
         if item.is_folder:
             self.total_folders += 1
@@ -289,28 +442,87 @@ class DriveStructure(BaseModel):
         """Get item by ID."""
         return self.all_items.get(item_id)
     
+    def _parent_index(self) -> Dict[Optional[str], List[DriveItem]]:
+        """Get items grouped by their first parent ID.
+        
+        The index filled in by ``add_item`` is used only while nothing else
+        has changed the structure since. Otherwise, e.g. for items set
+        directly (a structure loaded from the cache), replaced items, or
+        after a ``build_hierarchy`` that parents may have been edited since,
+        the items are regrouped from ``all_items``. That grouping isn't
+        kept, since later edits to ``parent_ids`` can't be detected.
+        """
+        if self._index_version == self._scan_version and self._indexed_items == len(self.all_items):
+            return self._items_by_parent
+        
+        index: Dict[Optional[str], List[DriveItem]] = {}
+        for item in self.all_items.values():
+            parent_ids = item.parent_ids
+            index.setdefault(parent_ids[0] if parent_ids else None, []).append(item)
+        return index
+    
     def build_hierarchy(self) -> None:
         """Build the hierarchical structure from flat item list."""
-        # First pass: identify root items and build parent-child relationships
-        for item in self.all_items.values():
-            if not item.parent_ids:
-                # Root item
-                if item.is_folder:
-                    self.root_folders.append(item)
-                else:
-                    self.root_files.append(item)
-                item.path = item.name
-            else:
-                # Find parents and add as child
-                for parent_id in item.parent_ids:
-                    parent = self.all_items.get(parent_id)
-                    if parent and parent.is_folder:
-                        parent.add_child(item)
+        all_items = self.all_items
+        
+        # Children per parent ID, attached in bulk
+        children_map: Dict[str, List[DriveItem]] = {}
+        linked: set = set()
+        
+        for parent_id, items in self._parent_index().items():
+            if parent_id is None:
+                # Root items
+                for item in items:
+                    if item.is_folder:
+                        self.root_folders.append(item)
+                    else:
+                        self.root_files.append(item)
+                    item.path = item.name
+                continue
+            
+            parent = all_items.get(parent_id)
+            if parent is not None and parent.is_folder:
+                children_map.setdefault(parent_id, []).extend(items)
+                linked.update(item.id for item in items)
+                continue
+            
+            # The first parent isn't a known folder; link to the next one that is
+            for item in items:
+                for other_id in item.parent_ids[1:]:
+                    other = all_items.get(other_id)
+                    if other is not None and other.is_folder:
+                        children_map.setdefault(other_id, []).append(item)
+                        linked.add(item.id)
                         break
         
+        # Attach each folder's children at once, keeping any already linked
+        for parent_id, children in children_map.items():
+            parent = all_items[parent_id]
+            if parent.children:
+                known = {c.id for c in parent.children}
+                parent.children.extend(c for c in children if c.id not in known)
+            else:
+                # A copy, so appending to a folder's children never touches the index
+                parent.children = list(children)
+        
+        # Set paths top-down from every item that isn't linked under a parent
+        stack = [item for item in all_items.values() if item.id not in linked]
+        visited = set()
+        while stack:
+            parent = stack.pop()
+            if parent.id in visited:
+                continue
+            visited.add(parent.id)
+            
+            for child in children_map.get(parent.id, ()):
+                child.path = f"{parent.path}/{child.name}".lstrip("/")
+                stack.append(child)
+        
         # Second pass: calculate folder sizes
         for folder in self.root_folders:
             folder.calculate_folder_size()
+        
+        self._scan_version += 1
     
     def get_largest_items(self, limit: int = 100, folders_only: bool = False) -> List[DriveItem]:
         """Get largest items sorted by size."""
@@ -327,9 +539,82 @@ class DriveStructure(BaseModel):
         
         return items[:limit]
     
+    def files_by_size(self, min_size: int = 0, max_size: Optional[int] = None,
+                      limit: Optional[int] = None) -> List[DriveItem]:
+        """Get files whose size falls within a range, largest first.
+        
+        Files are sorted by size on first use and the order is kept until
+        items are added or the hierarchy is rebuilt, so each lookup is a binary search and a slice
+        rather than a scan of every item. Only files are indexed: their
+        sizes are fixed once listed, unlike calculated folder sizes.
+        
+        Args:
+            min_size: Smallest size to include, in bytes
+            max_size: Largest size to include, in bytes (None for no limit)
+            limit: Maximum number of files to return
+            
+        Returns:
+            Matching files sorted by size, largest first
+        """
+        stamp = (self._scan_version, len(self.all_items), self.total_files, self.total_size)
+        index = self._file_size_index
+        if index is None or index[0] != stamp:
+            files = sorted(
+                (item for item in self.all_items.values() if not item.is_folder),
+                key=lambda x: x.size, reverse=True
+            )
+            # Negated so the largest-first order is ascending for bisect
+            index = self._file_size_index = (stamp, [-f.size for f in files], files)
+        
+        _, neg_sizes, files = index
+        start = 0 if max_size is None else bisect_left(neg_sizes, -max_size)
+        end = bisect_right(neg_sizes, -min_size)
+        if limit is not None:
+            end = min(end, start + limit)
+        return files[start:end]
+    
+    def columns(self) -> ItemColumns:
+        """Get a columnar snapshot of every item.
+        
+        Built on first use and kept until items are added or the hierarchy
+        is rebuilt.
+        
+        Returns:
+            ItemColumns with one row per item in ``all_items``
+        """
+        stamp = (self._scan_version, len(self.all_items), self.total_files, self.total_size)
+        cached = self._columns
+        if cached is None or cached[0] != stamp:
+            cached = self._columns = (stamp, ItemColumns.from_items(self.all_items.values()))
+        return cached[1]
+    
+    def folders(self) -> List[DriveItem]:
+        """Get every folder in the structure.
+        
+        Selected through the columnar snapshot's folder mask, so only the
+        folders themselves are visited in Python rather than every item.
+        
+        Returns:
+            List of folder items
+        """
+        columns = self.columns()
+        return list(compress(columns.items, columns.folder_mask))
+    
     def get_folder_stats(self) -> Dict[str, Any]:
-        """Get statistics about the folder structure."""
-        return {
+        """Get statistics about the folder structure.
+        
+        The result is cached until items are added, the hierarchy is rebuilt
+        or the scan status changes, so repeated summaries don't rebuild it.
+        
+        Returns:
+            Dictionary of item counts, total size and scan status
+        """
+        key = (self._scan_version, len(self.all_items), self.scan_complete, self.scan_timestamp)
+        cached = self._stats_cache
+        if cached is not None and cached[0] == key:
+            return dict(cached[1])
+        
+        stats = {
             'total_items': len(self.all_items),
             'total_files': self.total_files,
             'total_folders': self.total_folders,
@@ -339,6 +624,8 @@ class DriveStructure(BaseModel):
             'scan_complete': self.scan_complete,
             'scan_timestamp': self.scan_timestamp.isoformat() if self.scan_timestamp else None
         }
+        self._stats_cache = (key, stats)
+        return dict(stats)
 
 
 # Update forward references
@@ -3,6 +3,8 @@
 import logging
 import sys
 import time
+import threading
+from functools import lru_cache
 from pathlib import Path
 from typing import Union
 
@@ -29,9 +31,17 @@ def setup_logging(level: str = "INFO", log_file: str = "gdrive-explorer.log") ->
     )
 
 
+# Units used by format_file_size, in steps of 1024
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+
+@lru_cache(maxsize=4096)
 def format_file_size(size_bytes: int, human_readable: bool = True) -> str:
     """Format file size in human-readable format.
     
+    Results are memoized: listings repeat the same sizes (zero-byte
+    Workspace files, small config files) across every display path.
+    
     Args:
         size_bytes: File size in bytes
         human_readable: If True, format as KB/MB/GB, otherwise raw bytes
@@ -46,7 +56,7 @@ def format_file_size(size_bytes: int, human_readable: bool = True) -> str:
         return "0 B"
     
     # Convert to appropriate unit
-    units = ['B', 'KB', 'MB', 'GB', 'TB', 'PB']
+    units = _SIZE_UNITS
     unit_index = 0
     size = float(size_bytes)
     
@@ -138,6 +148,86 @@ def safe_get_nested_dict(data: dict, keys: list, default=None):
         return default
 
 
+class TokenBucket:
+    """Thread-safe token bucket rate limiter.
+    
+    Tokens refill continuously at ``rate`` per second up to ``capacity``, so
+    short bursts go through immediately while the long-run rate stays capped.
+    The rate can be lowered for a while with ``throttle`` when the server
+    pushes back, and returns to normal on its own afterwards.
+    """
+    
+    # Throttling never slows the bucket below this fraction of its base rate
+    MIN_RATE_FRACTION = 0.1
+    
+    def __init__(self, rate: float, capacity: float = 1.0):
+        """Initialize token bucket.
+        
+        Args:
+            rate: Tokens added per second (0 or less disables limiting)
+            capacity: Maximum tokens that can accumulate for a burst
+        """
+        self.rate = rate
+        self.base_rate = rate
+        self.capacity = max(1.0, capacity)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._throttled_until = 0.0
+        self._lock = threading.Lock()
+    
+    def throttle(self, factor: float = 0.5, duration: float = 30.0) -> None:
+        """Temporarily lower the refill rate.
+        
+        Repeated calls keep lowering the rate, down to ``MIN_RATE_FRACTION``
+        of the base rate, and each one extends the throttled period.
+        
+        Args:
+            factor: Multiplier applied to the current rate
+            duration: Seconds before the base rate is restored
+        """
+        if self.base_rate <= 0:
+            return
+        
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = max(self.rate * factor, self.base_rate * self.MIN_RATE_FRACTION)
+            self._throttled_until = time.monotonic() + duration
+    
+    def _refill(self, now: float) -> None:
+        """Add the tokens earned since the last update. Caller holds the lock."""
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        
+        if self._throttled_until and now >= self._throttled_until:
+            self.rate = self.base_rate
+            self._throttled_until = 0.0
+    
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Take tokens, sleeping until they are available.
+        
+        When the bucket is empty the caller reserves future tokens by taking
+        the balance negative, so waiting threads are served in arrival order
+        without polling.
+        
+        Args:
+            tokens: Number of tokens to take, e.g. one per call in a batch
+            
+        Returns:
+            Seconds spent waiting
+        """
+        if self.base_rate <= 0:
+            return 0.0
+        
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= tokens
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
 class ProgressTracker:
     """Enhanced progress tracking utility with rich output support."""
     
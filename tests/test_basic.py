@@ -184,6 +184,96 @@ class TestConfigAndUtils:
         assert "1.0 KB" in format_file_size(1024)
         assert "1.0 MB" in format_file_size(1024 * 1024)
     
+    def test_token_bucket(self):
+        """Test token bucket allows a burst, then paces requests."""
+        from src.gdrive_explorer.utils import TokenBucket
+        
+        bucket = TokenBucket(rate=100, capacity=3)
+        
+        # Burst is served without waiting
+        assert [bucket.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+        
+        # Next token has to be waited for
+        assert bucket.acquire() > 0
+        
+        # Zero rate disables limiting
+        assert TokenBucket(rate=0).acquire() == 0.0
+    
+    def test_token_bucket_batch(self):
+        """Test a batch takes one token per call."""
+        from src.gdrive_explorer.utils import TokenBucket
+        
+        bucket = TokenBucket(rate=1000, capacity=5)
+        
+        assert bucket.acquire(5) == 0.0
+        # The next batch waits for every call it makes, not just one
+        assert bucket.acquire(20) == pytest.approx(0.02, abs=0.005)
+    
+    def test_token_bucket_throttle(self):
+        """Test throttling lowers the rate for a while, within a floor."""
+        from src.gdrive_explorer.utils import TokenBucket
+        
+        bucket = TokenBucket(rate=100, capacity=3)
+        bucket.throttle(factor=0.5, duration=60)
+        assert bucket.rate == 50
+        
+        # Repeated throttles stop at the minimum fraction of the base rate
+        for _ in range(10):
+            bucket.throttle(factor=0.5, duration=60)
+        assert bucket.rate == 100 * TokenBucket.MIN_RATE_FRACTION
+        
+        # The base rate comes back once the throttle expires
+        bucket.throttle(duration=0)
+        bucket.acquire()
+        assert bucket.rate == 100
+    
+    def test_parse_size_string(self):
+        """Test size strings with and without the trailing B."""
+        from src.gdrive_explorer.display import parse_size_string
+        
+        assert parse_size_string("100") == 100
+        assert parse_size_string("10MB") == 10 * 1024**2
+        assert parse_size_string("10M") == 10 * 1024**2
+        assert parse_size_string("1.5 gb") == int(1.5 * 1024**3)
+        
+        with pytest.raises(ValueError):
+            parse_size_string("ten megabytes")
+    
+    def test_compact_list_counts_matching_items(self):
+        """Test the "more items" footer ignores filtered-out items."""
+        from rich.console import Console
+        from src.gdrive_explorer.display import DriveDisplayManager, FilterOptions
+        from src.gdrive_explorer.models import DriveItem, ItemType
+        
+        console = Console(record=True, width=100)
+        items = [
+            DriveItem(id=str(i), name=f"f{i}.txt", type=ItemType.FILE, mime_type="text/plain", size=i)
+            for i in range(1, 6)
+        ]
+        filters = FilterOptions()
+        filters.min_size = 3
+        
+        DriveDisplayManager(console).display_compact_list(items, limit=2, filters=filters)
+        
+        assert "... and 1 more items" in console.export_text()
+    
+    def test_item_icons(self):
+        """Test icons for exact, prefixed and unusual MIME types."""
+        from rich.console import Console
+        from src.gdrive_explorer.display import DriveDisplayManager
+        from src.gdrive_explorer.models import DriveItem, ItemType
+        
+        display = DriveDisplayManager(Console())
+        
+        def icon(mime_type):
+            item = DriveItem(id="1", name="f", type=ItemType.FILE, mime_type=mime_type)
+            return display._get_item_icon(item)
+        
+        assert icon("application/pdf") == "📕"
+        assert icon("application/x-pdf") == "📕"
+        assert icon("image/png") == "🖼️"
+        assert icon("text/plain") == "📄"
+    
     def test_config_import(self):
         """Test config can be imported."""
         from src.gdrive_explorer.config import get_config
@@ -98,6 +98,23 @@ class TestDriveCache:
         assert retrieved.total_files == sample_drive_structure.total_files
         assert retrieved.total_folders == sample_drive_structure.total_folders
     
+    def test_cache_api_response(self, temp_cache):
+        """Test caching raw API responses."""
+        response = {
+            'files': [{'id': 'file1', 'name': 'a.txt', 'size': '10'}],
+            'nextPageToken': 'token2'
+        }
+        
+        assert temp_cache.get_response("page1") is None
+        assert temp_cache.cache_response("page1", response)
+        assert temp_cache.get_response("page1") == response
+        
+        stats = temp_cache.get_cache_stats()
+        assert stats['responses_count'] == 1
+        
+        assert temp_cache.clear_all()
+        assert temp_cache.get_response("page1") is None
+    
     def test_cache_invalidation(self, temp_cache):
         """Test cache invalidation."""
         item = DriveItem(
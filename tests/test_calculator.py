@@ -99,7 +99,7 @@ class TestSizeCalculation:
         structure.add_item(file2)
         
         # Calculate size
-        total_size = mock_calculator._calculate_folder_size_recursive(folder, structure)
+        total_size = mock_calculator._calculate_folder_size(folder, structure)
         
         assert total_size == 3072  # 1024 + 2048
         assert folder.calculated_size == 3072
@@ -123,13 +123,35 @@ class TestSizeCalculation:
             structure.add_item(item)
         
         # Calculate size
-        total_size = mock_calculator._calculate_folder_size_recursive(root, structure)
+        total_size = mock_calculator._calculate_folder_size(root, structure)
         
         assert total_size == 3000  # 1000 + 2000
         assert root.calculated_size == 3000
         assert root.file_count == 2  # Total files in tree
         assert root.folder_count == 1  # Direct subfolders only
     
+    def test_calculate_deep_folder_chain(self, mock_calculator):
+        """Test trees deeper than the recursion limit are calculated."""
+        folder_mime = "application/vnd.google-apps.folder"
+        depth = 1500
+        folders = [
+            DriveItem(id=f"f{i}", name=f"F{i}", type=ItemType.FOLDER, mime_type=folder_mime, size=0)
+            for i in range(depth)
+        ]
+        for parent, child in zip(folders, folders[1:]):
+            parent.children = [child]
+        folders[-1].children = [
+            DriveItem(id="leaf", name="leaf.txt", type=ItemType.FILE, mime_type="text/plain", size=10)
+        ]
+        
+        total_size = mock_calculator._calculate_folder_size(folders[0], DriveStructure())
+        
+        assert total_size == 10
+        assert folders[0].file_count == 1
+        assert folders[0].folder_count == depth - 1
+        assert not mock_calculator._processing_folders
+        assert not mock_calculator._folder_stack
+    
     def test_calculate_google_workspace_files(self, mock_calculator):
         """Test handling Google Workspace files (zero size)."""
         folder = DriveItem(id="folder", name="Folder", type=ItemType.FOLDER, mime_type="application/vnd.google-apps.folder", size=0)
@@ -161,7 +183,7 @@ class TestSizeCalculation:
         structure.add_item(regular_file)
         structure.add_item(workspace_file)
         
-        total_size = mock_calculator._calculate_folder_size_recursive(folder, structure)
+        total_size = mock_calculator._calculate_folder_size(folder, structure)
         
         # Should include regular file size but still count workspace file
         assert total_size == 5000
@@ -271,13 +293,13 @@ class TestErrorHandling:
         structure.add_item(protected_folder)
         
         # Mock calculation to raise permission error
-        original_method = mock_calculator._calculate_folder_size_recursive
+        original_method = mock_calculator._calculate_folder_size
         def mock_calculate(folder, structure):
             if folder.id == "protected":
                 raise PermissionError("Access denied")
             return original_method(folder, structure)
         
-        with patch.object(mock_calculator, '_calculate_folder_size_recursive', side_effect=mock_calculate):
+        with patch.object(mock_calculator, '_calculate_folder_size', side_effect=mock_calculate):
             # Should not raise exception, but handle gracefully
             result = mock_calculator.calculate_full_drive_sizes(structure)
             
@@ -292,7 +314,7 @@ class TestErrorHandling:
         structure.add_item(folder)
         
         call_count = 0
-        original_method = mock_calculator._calculate_folder_size_recursive
+        original_method = mock_calculator._calculate_folder_size
         
         def mock_calculate(folder, structure):
             nonlocal call_count
@@ -301,7 +323,7 @@ class TestErrorHandling:
                 raise RateLimitError("Rate limit exceeded")
             return 0  # Success on retry
         
-        with patch.object(mock_calculator, '_calculate_folder_size_recursive', side_effect=mock_calculate):
+        with patch.object(mock_calculator, '_calculate_folder_size', side_effect=mock_calculate):
             with patch('time.sleep'):  # Speed up test
                 result = mock_calculator.calculate_full_drive_sizes(structure)
                 
@@ -320,7 +342,7 @@ class TestErrorHandling:
         # Add folder to its own processing set to simulate circular reference
         mock_calculator._processing_folders.add("circular")
         
-        result = mock_calculator._calculate_folder_size_recursive(folder, structure)
+        result = mock_calculator._calculate_folder_size(folder, structure)
         
         # Should return 0 for circular reference
         assert result == 0
@@ -350,7 +372,7 @@ class TestCacheIntegration:
         structure = DriveStructure()
         structure.add_item(folder)
         
-        result = mock_calculator._calculate_folder_size_recursive(folder, structure)
+        result = mock_calculator._calculate_folder_size(folder, structure)
         
         assert result == 5000
         assert mock_calculator._cache_hits > 0
@@ -378,7 +400,7 @@ class TestCacheIntegration:
         mock_calculator.cache.get_item.return_value = None
         mock_calculator.cache.cache_item.return_value = True
         
-        result = mock_calculator._calculate_folder_size_recursive(folder, structure)
+        result = mock_calculator._calculate_folder_size(folder, structure)
         
         assert result == 1000
         # Should have attempted to cache the result
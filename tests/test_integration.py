@@ -1,11 +1,14 @@
 """Integration tests for gdrive-explorer components."""
 
+import json
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from click.testing import CliRunner
+from googleapiclient.errors import HttpError
 from datetime import datetime, timedelta
 
 from src.gdrive_explorer.cli import main
+from src.gdrive_explorer.client import DriveClient, LIST_FIELDS
 from src.gdrive_explorer.explorer import DriveExplorer
 from src.gdrive_explorer.models import DriveItem, DriveStructure, ItemType
 
@@ -68,6 +71,216 @@ class TestExplorerIntegration:
                         
                         assert result is not None
                         assert isinstance(result, DriveStructure)
+    
+    def test_compute_analytics_matches_reports(self, mock_explorer, sample_drive_structure):
+        """Test the fused analytics pass agrees with the individual reports."""
+        analytics = mock_explorer.compute_analytics(sample_drive_structure, file_limit=2, folder_limit=2)
+        
+        assert analytics.largest_files == mock_explorer.find_largest_files(sample_drive_structure, limit=2)
+        assert analytics.largest_folders == mock_explorer.find_largest_folders(sample_drive_structure, limit=2)
+        assert analytics.empty_folders == mock_explorer.find_empty_folders(sample_drive_structure)
+        
+        file_types = mock_explorer.analyze_file_types(sample_drive_structure)
+        assert set(analytics.file_types) == set(file_types)
+        for file_type, stats in file_types.items():
+            expected = analytics.file_types[file_type]
+            assert stats['count'] == expected['count']
+            assert stats['total_size'] == expected['total_size']
+            assert sorted(stats['mime_types']) == sorted(expected['mime_types'])
+    
+    def test_fetch_all_files_hands_over_pages(self, mock_explorer):
+        """Test each page is passed on as it arrives and all files are returned."""
+        pages = [[{'id': '1'}, {'id': '2'}], [{'id': '3'}]]
+        mock_explorer.client.iter_pages.return_value = iter(pages)
+        received = []
+        
+        files = mock_explorer._fetch_all_files(page_callback=received.append)
+        
+        assert [f['id'] for f in files] == ['1', '2', '3']
+        assert received == pages
+        # Scanned items are cached, so they need the full metadata
+        assert mock_explorer.client.iter_pages.call_args.kwargs['fields'] == LIST_FIELDS
+        
+        # Without collecting, pages are only handed over
+        mock_explorer.client.iter_pages.return_value = iter(pages)
+        assert mock_explorer._fetch_all_files(page_callback=received.append, collect=False) == []
+        assert received == pages + pages
+    
+    def test_fetch_all_files_complete_keeps_partial_results(self, mock_explorer):
+        """Test pages fetched before a failure are kept."""
+        def list_all_files(query, show_progress, page_size, page_callback, fields):
+            page_callback([{'id': '1'}, {'id': '2'}])
+            raise Exception("Server error")
+        
+        mock_explorer.client.list_all_files.side_effect = list_all_files
+        
+        files = mock_explorer._fetch_all_files_complete()
+        
+        assert [f['id'] for f in files] == ['1', '2']
+    
+    def test_fetch_all_files_complete_permission_errors(self, mock_explorer):
+        """Test only real access errors become PermissionError."""
+        def http_error(status, reason):
+            content = json.dumps({'error': {
+                'code': status,
+                'message': f'Request failed: {reason}',
+                'errors': [{'domain': 'usageLimits', 'reason': reason, 'message': reason}],
+            }}).encode()
+            return HttpError(Mock(status=status, reason=reason), content)
+        
+        mock_explorer.client.list_all_files.side_effect = http_error(403, 'insufficientPermissions')
+        with pytest.raises(PermissionError):
+            mock_explorer._fetch_all_files_complete()
+        
+        mock_explorer.client.list_all_files.side_effect = http_error(403, 'userRateLimitExceeded')
+        with pytest.raises(HttpError):
+            mock_explorer._fetch_all_files_complete()
+        
+        # Bodies without a message still carry their reasons
+        content = json.dumps({'error': {'errors': [{'reason': 'rateLimitExceeded'}]}}).encode()
+        mock_explorer.client.list_all_files.side_effect = HttpError(Mock(status=403, reason='Forbidden'), content)
+        with pytest.raises(HttpError):
+            mock_explorer._fetch_all_files_complete()
+    
+    def test_scan_folder_lists_subfolders(self, mock_explorer):
+        """Test folder scan attaches children from batched listings."""
+        folder_mime = 'application/vnd.google-apps.folder'
+        children = {
+            'root': [
+                {'id': 'sub1', 'name': 'Sub 1', 'mimeType': folder_mime},
+                {'id': 'sub2', 'name': 'Sub 2', 'mimeType': folder_mime},
+                {'id': 'a', 'name': 'a.txt', 'mimeType': 'text/plain', 'size': '100'},
+            ],
+            'sub1': [{'id': 'b', 'name': 'b.txt', 'mimeType': 'text/plain', 'size': '200'}],
+            'sub2': [{'id': 'c', 'name': 'c.txt', 'mimeType': 'text/plain', 'size': '300'}],
+        }
+        mock_explorer.client.get_file_metadata.return_value = {
+            'id': 'root', 'name': 'Root', 'mimeType': folder_mime
+        }
+        mock_explorer.client.batch_get_folder_children.side_effect = \
+            lambda ids: {fid: children[fid] for fid in ids}
+        
+        folder = mock_explorer.scan_folder('root')
+        
+        assert folder.calculated_size == 600
+        assert folder.file_count == 3
+        assert folder.folder_count == 2
+        # One batch for the root, one for both subfolders
+        assert mock_explorer.client.batch_get_folder_children.call_count == 2
+
+    
+    def test_scan_folder_repeated(self, mock_explorer):
+        """Test folders can be scanned again, alone or after their parent."""
+        folder_mime = 'application/vnd.google-apps.folder'
+        metadata = {
+            'root': {'id': 'root', 'name': 'Root', 'mimeType': folder_mime},
+            'sub': {'id': 'sub', 'name': 'Sub', 'mimeType': folder_mime, 'parents': ['root']},
+        }
+        children = {
+            'root': [{'id': 'sub', 'name': 'Sub', 'mimeType': folder_mime}],
+            'sub': [{'id': 'a', 'name': 'a.txt', 'mimeType': 'text/plain', 'size': '100'}],
+        }
+        mock_explorer.client.get_file_metadata.side_effect = lambda fid: metadata[fid]
+        mock_explorer.client.batch_get_folder_children.side_effect = \
+            lambda ids: {fid: children[fid] for fid in ids}
+        
+        first = mock_explorer.scan_folder('root')
+        second = mock_explorer.scan_folder('root')
+        nested = mock_explorer.scan_folder('sub')
+        
+        assert [child.id for child in first.children] == ['sub']
+        assert [child.id for child in second.children] == ['sub']
+        assert second.children[0].children[0].id == 'a'
+        assert [child.id for child in nested.children] == ['a']
+        assert not mock_explorer._scanned_folders
+
+
+class TestDriveClientBatching:
+    """Test batched Drive requests."""
+    
+    @pytest.fixture
+    def batch_client(self):
+        """Create a DriveClient whose service answers batches from memory."""
+        with patch('googleapiclient.discovery.build'):
+            client = DriveClient(credentials=Mock())
+        client.service = Mock()
+        client._rate_limiter = Mock()
+        
+        def new_batch_http_request(callback):
+            batch = Mock()
+            request_ids = []
+            batch.add.side_effect = lambda request, request_id: request_ids.append(request_id)
+            batch.execute.side_effect = lambda http: [
+                callback(request_id, {'files': [{'id': f'{request_id}-child'}]}, None)
+                for request_id in request_ids
+            ]
+            return batch
+        
+        client.service.new_batch_http_request.side_effect = new_batch_http_request
+        return client
+    
+    def test_folder_listing_batch_charges_every_call(self, batch_client):
+        """Test each listing in a batch takes a rate-limit token."""
+        children = batch_client.batch_get_folder_children(['a', 'b', 'c'])
+        
+        assert {folder_id: [c['id'] for c in files] for folder_id, files in children.items()} == {
+            'a': ['a-child'], 'b': ['b-child'], 'c': ['c-child']
+        }
+        batch_client._rate_limiter.acquire.assert_called_once_with(3)
+    
+    def test_metadata_batch(self, batch_client):
+        """Test metadata for many files is fetched in one batch."""
+        metadata = batch_client.get_files_metadata_batch(['a', 'b', 'a'])
+        
+        assert set(metadata) == {'a', 'b'}
+        assert batch_client.service.new_batch_http_request.call_count == 1
+        batch_client._rate_limiter.acquire.assert_called_once_with(2)
+    
+    def test_metadata_served_from_memory(self, batch_client):
+        """Test repeated metadata lookups skip the API."""
+        batch_client.service.files().get().execute.return_value = {'id': 'a', 'name': 'A'}
+        
+        assert batch_client.get_file_metadata('a')['name'] == 'A'
+        assert batch_client.get_file_metadata('a')['name'] == 'A'
+        assert batch_client._rate_limiter.acquire.call_count == 1
+        
+        metadata = batch_client.get_files_metadata_batch(['a', 'b'])
+        
+        assert metadata['a']['name'] == 'A'
+        batch_client._rate_limiter.acquire.assert_called_with(1)
+        
+        batch_client.clear_metadata_cache()
+        assert batch_client.get_request_stats()['metadata_cache_entries'] == 0
+    
+    def test_walk_tree_lists_subfolders_in_batches(self, batch_client):
+        """Test walk_tree descends through folders listed in batches."""
+        tree = {
+            'root': [{'id': 'a', 'mimeType': 'application/vnd.google-apps.folder'},
+                     {'id': 'b', 'mimeType': 'application/vnd.google-apps.folder'},
+                     {'id': 'f', 'mimeType': 'text/plain'}],
+            'a': [{'id': 'c', 'mimeType': 'application/vnd.google-apps.folder'}],
+            'b': [],
+            'c': [],
+        }
+        batch_client.batch_get_folder_children = Mock(
+            side_effect=lambda folder_ids: {folder_id: tree[folder_id] for folder_id in folder_ids}
+        )
+        
+        listings = dict(batch_client.walk_tree('root', max_workers=1))
+        
+        assert listings == tree
+        assert batch_client.batch_get_folder_children.call_args_list[1].args == (['a', 'b'],)
+    
+    def test_shard_query_bounds_are_utc(self, batch_client):
+        """Test sharded listings split on UTC timestamps and are opt-in."""
+        assert batch_client._shard_query("trashed=false", 1) == ["trashed=false"]
+        
+        first, second = batch_client._shard_query("trashed=false", 2)
+        
+        assert first.startswith("(trashed=false) and modifiedTime < '")
+        assert first.endswith("Z'")
+        assert "modifiedTime >= '" in second and second.endswith("Z'")
+        assert batch_client.config.api.list_shards == 1
 
 
 class TestCLIIntegration:
@@ -169,6 +382,24 @@ class TestCLIIntegration:
                 mock_confirm.assert_called_once()
                 mock_cache.clear_all.assert_called_once()
     
+    def test_search_matches_inside_words(self, cli_runner):
+        """Test search finds patterns in the middle of a name."""
+        with patch('src.gdrive_explorer.cli.DriveClient') as mock_client_class:
+            mock_client = mock_client_class.return_value
+            mock_client.build_search_query.side_effect = DriveClient.build_search_query
+            mock_client.iter_files.return_value = [
+                {'id': '1', 'name': 'photo.jpg', 'mimeType': 'image/jpeg', 'size': '100'},
+                {'id': '2', 'name': 'notes.txt', 'mimeType': 'text/plain', 'size': '200'},
+            ]
+            
+            result = cli_runner.invoke(main, ['search', '--pattern', 'hoto', '--no-cache'])
+            
+            assert result.exit_code == 0
+            assert 'photo.jpg' in result.output
+            assert 'notes.txt' not in result.output
+            query = mock_client.iter_files.call_args.kwargs['query']
+            assert query is None or 'name contains' not in query
+    
     def test_error_handling_in_cli(self, cli_runner):
         """Test CLI error handling."""
         with patch('src.gdrive_explorer.cli.DriveExplorer') as mock_explorer_class:
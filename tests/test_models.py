@@ -60,6 +60,55 @@ class TestDriveItem:
         assert item.is_google_workspace_file
         assert not item.is_folder
     
+    def test_from_drive_api(self):
+        """Test creating items from Drive API responses."""
+        item = DriveItem.from_drive_api({
+            'id': 'file123',
+            'name': 'photo.jpg',
+            'mimeType': 'image/jpeg',
+            'size': '2048',
+            'parents': ['folder456'],
+            'modifiedTime': '2024-01-15T10:30:00.000Z',
+            'shared': True
+        })
+        
+        assert item.id == 'file123'
+        assert item.type == ItemType.FILE
+        assert item.size == 2048
+        assert item.parent_ids == ['folder456']
+        assert item.modified_time.year == 2024
+        assert item.is_shared
+        
+        folder = DriveItem.from_drive_api({
+            'id': 'folder123',
+            'mimeType': 'application/vnd.google-apps.folder'
+        })
+        assert folder.is_folder
+        assert folder.name == 'Unknown'
+        assert folder.children == []
+        
+        sheet = DriveItem.from_drive_api({
+            'id': 'sheet123',
+            'name': 'Budget',
+            'mimeType': 'application/vnd.google-apps.spreadsheet',
+            'size': 'not-a-number'
+        })
+        assert sheet.type == ItemType.GOOGLE_SHEET
+        assert sheet.is_google_workspace_file
+        assert sheet.size == 0
+    
+    def test_from_drive_api_batch(self):
+        """Test batch creation skips malformed API entries."""
+        items = DriveItem.from_drive_api_batch([
+            {'id': 'file1', 'name': 'a.txt', 'mimeType': 'text/plain', 'size': '10'},
+            {'name': 'no-id.txt', 'mimeType': 'text/plain'},
+            {'id': 'folder1', 'name': 'Docs', 'mimeType': 'application/vnd.google-apps.folder'}
+        ])
+        
+        assert [item.id for item in items] == ['file1', 'folder1']
+        assert items[0].size == 10
+        assert items[1].is_folder
+    
     def test_add_child_to_folder(self):
         """Test adding children to folder."""
         folder = DriveItem(
@@ -94,6 +143,42 @@ class TestDriveItem:
         assert file1 in folder.children
         assert file2 in folder.children
     
+    def test_partition_children(self):
+        """Test splitting folder children into folders and files."""
+        folder = DriveItem(
+            id="folder1",
+            name="Parent",
+            type=ItemType.FOLDER,
+            mime_type="application/vnd.google-apps.folder"
+        )
+        subfolder = DriveItem(
+            id="folder2",
+            name="Child",
+            type=ItemType.FOLDER,
+            mime_type="application/vnd.google-apps.folder"
+        )
+        file1 = DriveItem(
+            id="file1",
+            name="child1.txt",
+            type=ItemType.FILE,
+            mime_type="text/plain",
+            size=100
+        )
+        
+        folder.children.extend([file1, subfolder])
+        assert folder.partition_children() == ([subfolder], [file1])
+        
+        # Adding a child invalidates the cached split
+        file2 = DriveItem(
+            id="file2",
+            name="child2.txt",
+            type=ItemType.FILE,
+            mime_type="text/plain",
+            size=200
+        )
+        folder.add_child(file2)
+        assert folder.partition_children() == ([subfolder], [file1, file2])
+    
     def test_item_equality(self):
         """Test DriveItem equality comparison."""
         item1 = DriveItem(id="123", name="test", type=ItemType.FILE, mime_type="text/plain", size=100)
@@ -182,6 +267,48 @@ class TestDriveStructure:
             assert not file_item.is_folder
             assert file_item.type in [ItemType.FILE, ItemType.GOOGLE_DOC, ItemType.GOOGLE_SHEET, ItemType.GOOGLE_SLIDE]
     
+    def test_files_by_size(self, sample_drive_structure):
+        """Test selecting files by size range, largest first."""
+        ids = lambda items: [item.id for item in items]
+        
+        assert ids(sample_drive_structure.files_by_size(min_size=1)) == ['file4', 'file1', 'file2']
+        assert ids(sample_drive_structure.files_by_size(min_size=600 * 1024)) == ['file4', 'file1']
+        assert ids(sample_drive_structure.files_by_size(max_size=1024 * 1024)) == ['file1', 'file2', 'file3']
+        assert ids(sample_drive_structure.files_by_size(limit=1)) == ['file4']
+    
+    def test_columns(self, sample_drive_structure):
+        """Test the columnar snapshot lines up with the items."""
+        columns = sample_drive_structure.columns()
+        
+        assert len(columns.items) == len(sample_drive_structure.all_items)
+        for i, item in enumerate(columns.items):
+            assert columns.sizes[i] == item.size
+            assert columns.folder_mask[i] == item.is_folder
+            assert columns.file_mask[i] == (not item.is_folder)
+            assert columns.child_counts[i] == len(item.children)
+        
+        # Reused until the structure changes
+        assert sample_drive_structure.columns() is columns
+        sample_drive_structure.add_item(DriveItem(id="extra", name="extra.txt", type=ItemType.FILE, mime_type="text/plain"))
+        assert sample_drive_structure.columns() is not columns
+    
+    def test_folders(self, sample_drive_structure):
+        """Test selecting only the folders."""
+        expected = [item for item in sample_drive_structure.all_items.values() if item.is_folder]
+        assert sample_drive_structure.folders() == expected
+    
+    def test_folder_stats_refresh_after_add(self, sample_drive_structure):
+        """Test cached folder stats are refreshed when items are added."""
+        before = sample_drive_structure.get_folder_stats()
+        
+        sample_drive_structure.add_item(DriveItem(
+            id="extra", name="extra.txt", type=ItemType.FILE, mime_type="text/plain", size=10
+        ))
+        after = sample_drive_structure.get_folder_stats()
+        
+        assert after['total_items'] == before['total_items'] + 1
+        assert after['total_size'] == before['total_size'] + 10
+    
     def test_get_folders_only(self, sample_drive_structure):
         """Test getting only folders from structure."""
         folders = [item for item in sample_drive_structure.all_items.values() if item.is_folder]
@@ -217,6 +344,74 @@ class TestDriveStructure:
         empty_contents = [item for item in sample_drive_structure.all_items.values() if "nonexistent" in item.parent_ids]
         assert len(empty_contents) == 0
     
+    def test_build_hierarchy(self):
+        """Test linking items to their parents."""
+        structure = DriveStructure()
+        root = DriveItem(id="root", name="Root", type=ItemType.FOLDER, mime_type="application/vnd.google-apps.folder")
+        sub = DriveItem(id="sub", name="Sub", type=ItemType.FOLDER, mime_type="application/vnd.google-apps.folder", parent_ids=["root"])
+        file1 = DriveItem(id="file1", name="a.txt", type=ItemType.FILE, mime_type="text/plain", size=100, parent_ids=["sub"])
+        
+        for item in (root, sub, file1):
+            structure.add_item(item)
+        
+        structure.build_hierarchy()
+        
+        assert [child.id for child in root.children] == ["sub"]
+        assert [child.id for child in sub.children] == ["file1"]
+        assert sub.path == "Root/Sub"
+        assert structure.root_folders == [root]
+    
+    def test_build_hierarchy_child_before_parent(self):
+        """Test paths don't depend on the order items were added in."""
+        structure = DriveStructure()
+        root = DriveItem(id="root", name="Root", type=ItemType.FOLDER, mime_type="application/vnd.google-apps.folder")
+        sub = DriveItem(id="sub", name="Sub", type=ItemType.FOLDER, mime_type="application/vnd.google-apps.folder", parent_ids=["root"])
+        file1 = DriveItem(id="file1", name="a.txt", type=ItemType.FILE, mime_type="text/plain", size=100, parent_ids=["sub"])
+        
+        for item in (file1, sub, root):
+            structure.add_item(item)
+        
+        structure.build_hierarchy()
+        
+        assert [child.id for child in sub.children] == ["file1"]
+        assert file1.path == "Root/Sub/a.txt"
+    
+    def test_build_hierarchy_loaded_items(self):
+        """Test items set without add_item are still linked."""
+        root = DriveItem(id="root", name="Root", type=ItemType.FOLDER, mime_type="application/vnd.google-apps.folder")
+        file1 = DriveItem(id="file1", name="a.txt", type=ItemType.FILE, mime_type="text/plain", size=100, parent_ids=["missing", "root"])
+        structure = DriveStructure(all_items={"root": root, "file1": file1})
+        
+        structure.build_hierarchy()
+        
+        assert [child.id for child in root.children] == ["file1"]
+        assert file1.path == "Root/a.txt"
+        assert structure.root_folders == [root]
+    
+    def test_build_hierarchy_after_parent_change(self):
+        """Test a rebuild follows parents edited after the first build."""
+        folder_mime = "application/vnd.google-apps.folder"
+        structure = DriveStructure()
+        a = DriveItem(id="a", name="A", type=ItemType.FOLDER, mime_type=folder_mime)
+        b = DriveItem(id="b", name="B", type=ItemType.FOLDER, mime_type=folder_mime)
+        file1 = DriveItem(id="file1", name="a.txt", type=ItemType.FILE, mime_type="text/plain", size=100, parent_ids=["a"])
+        for item in (a, b, file1):
+            structure.add_item(item)
+        structure.build_hierarchy()
+        
+        # Appending to children must not leak into the parent index
+        a.children.append(DriveItem(id="extra", name="x.txt", type=ItemType.FILE, mime_type="text/plain"))
+        assert [item.id for item in structure._parent_index()["a"]] == ["file1"]
+        
+        file1.parent_ids = ["b"]
+        a.children = []
+        structure.root_folders = []
+        structure.build_hierarchy()
+        
+        assert [child.id for child in b.children] == ["file1"]
+        assert a.children == []
+        assert file1.path == "B/a.txt"
+    
     def test_structure_statistics_update(self, sample_drive_structure):
         """Test updating structure statistics."""
         # Update statistics